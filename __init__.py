@@ -55,11 +55,51 @@ class AnimSequenceIO_UpdatePreferences(AddonPreferences):
         max=59
     )
 
+    # Streamed playback settings
+    frame_cache_budget_mb: IntProperty(
+        name="Frame Cache (MB)",
+        description="Memory used to keep recently decoded frames of streamed sequences",
+        default=512,
+        min=0,
+        update=lambda self, context: utils.stream_playback.apply_preferences(self),
+    )
+
+    use_prefetch: BoolProperty(
+        name="Read Ahead",
+        description="Decode upcoming frames of streamed sequences in a background thread",
+        default=True,
+    )
+
+    prefetch_max_frames: IntProperty(
+        name="Max Read Ahead",
+        description="Upper limit of frames decoded ahead of the playhead; "
+                    "the actual lookahead adapts to playback speed and read latency",
+        default=32,
+        min=1,
+        max=1024,
+        update=lambda self, context: utils.stream_playback.apply_preferences(self),
+    )
+
     def draw(self, context):
         layout = self.layout
         layout.label(text="Update Settings:")
         addon_updater_ops.update_settings_ui(self, context, layout)
 
+        layout.separator()
+        layout.label(text="Streamed Playback:")
+        layout.prop(self, "frame_cache_budget_mb")
+        row = layout.row()
+        row.prop(self, "use_prefetch")
+        sub = row.row()
+        sub.active = self.use_prefetch
+        sub.prop(self, "prefetch_max_frames")
+
+        frame_lru = utils.stream_playback.frame_lru
+        col = layout.column(align=True)
+        col.label(text=f"Cached: {len(frame_lru)} frames, {frame_lru.used_bytes / (1024 * 1024):.1f} MB")
+        col.label(text=f"Hits: {frame_lru.hits}  Misses: {frame_lru.misses}  ({frame_lru.hit_rate:.0%})")
+        layout.operator("anim_seq.clear_frame_cache")
+
 
 # REGISTRATION
 
@@ -73,6 +113,7 @@ def register():
     bpy.utils.register_class(AnimSequenceIO_UpdatePreferences)
     
 
+    utils.register()
     operators.register()
     ui.register()
 
@@ -82,6 +123,7 @@ def unregister():
   
     ui.unregister()
     operators.unregister()
+    utils.unregister()
     
 
     bpy.utils.unregister_class(AnimSequenceIO_UpdatePreferences)
@@ -1,9 +1,11 @@
 from . import import_sequence
 from . import export_sequence
+from . import frame_cache_ops
 
 modules = (
     import_sequence,
     export_sequence,
+    frame_cache_ops,
 )
 
 def register():
@@ -1,5 +1,9 @@
 import bpy
+import json
 import os
+import shutil
+import tempfile
+import numpy as np
 from bpy_extras.io_utils import ExportHelper
 from bpy.props import (
     StringProperty,
@@ -9,9 +13,85 @@ from bpy.props import (
     FloatProperty,
 )
 
+from ..utils.mesh_utils import (
+    MeshSample,
+    get_shapekey_positions,
+    get_topology,
+    get_triangles,
+    get_vertex_positions,
+    transform_positions,
+)
+from ..utils.export_manifest import (
+    MANIFEST_SUFFIX,
+    ExportManifest,
+    hash_settings,
+)
+from ..utils.obj_writer import ObjSequenceWriter, to_obj_axes
+from ..utils.binary_mesh import write_ply, write_stl
+from ..utils.point_cache import PointCacheWriter
+from ..utils.usd_writer import UsdSequenceWriter, usd_available
+from ..utils.gltf_writer import GltfMorphWriter
+from ..utils.shapekey_eval import ShapeKeyEvaluator, supports_shapekey_eval
+from ..utils.armature_skinning import ArmatureSkinning, get_skinning_modifier
+from ..utils.export_pipeline import WritePipeline
+from ..utils.export_journal import (
+    ExportJournal,
+    link_atomic,
+    partial_path,
+    remove_partial_files,
+    rename_partial_mtl,
+    write_atomic,
+)
+from ..utils.shard_runner import (
+    DONE_PREFIX,
+    PROGRESS_PREFIX,
+    SHARD_SCRIPT,
+    run_shards,
+    split_frames,
+)
+
+
+# Object types that can be evaluated to a mesh
+GEOMETRY_TYPES = {'MESH', 'CURVE', 'SURFACE', 'FONT', 'META'}
+
+# File extension written by each format
+FORMAT_EXTENSIONS = {
+    'FBX': ".fbx",
+    'OBJ': ".obj",
+    'PLY': ".ply",
+    'STL': ".stl",
+    'PC2': ".pc2",
+    'MDD': ".mdd",
+    'ABC': ".abc",
+    'USD': ".usd",
+    'GLB': ".glb",
+}
+
+# Per-frame formats written by the built-in writers
+BINARY_MESH_FORMATS = {'PLY', 'STL'}
+
+# Formats that only need positions per frame, so shapekey-only and
+# armature-only objects can be evaluated numerically (the built-in OBJ
+# writer also needs normals)
+NUMERIC_EVAL_FORMATS = {'PLY', 'STL', 'PC2', 'MDD', 'USD'}
+
+# Formats that write all frames of an object into a single file
+POINT_CACHE_FORMATS = {'PC2', 'MDD'}
+
+# Formats that write all frames of all objects into a single archive
+ARCHIVE_FORMATS = {'ABC', 'USD', 'GLB'}
+
+# Module name background Blender instances enable to run export shards
+ADDON_MODULE = __package__.rpartition('.')[0]
+
+
+def clean_filename(filename):
+    """Remove characters that are invalid in file names"""
+    return filename.replace("*", "").replace("?", "").replace('"', "").replace("<", "").replace(">", "").replace("|", "")
+
 
 class ANIM_SEQ_OT_export_sequence(bpy.types.Operator, ExportHelper):
-    """Export mesh sequence (FBX/OBJ) for each frame"""
+    """Export mesh sequence (FBX/OBJ/PLY/STL) for each frame, or as point caches or one archive"""
     
     bl_idname = "export_scene.meshseq"
     bl_label = "Export Mesh Sequence"
@@ -19,7 +99,7 @@ class ANIM_SEQ_OT_export_sequence(bpy.types.Operator, ExportHelper):
 
     filename_ext = ".fbx"
     filter_glob: StringProperty(
-        default="*.fbx;*.obj",
+        default="*.fbx;*.obj;*.ply;*.stl;*.pc2;*.mdd;*.abc;*.usd;*.glb",
         options={'HIDDEN'},
     )
 
@@ -30,6 +110,13 @@ class ANIM_SEQ_OT_export_sequence(bpy.types.Operator, ExportHelper):
         items=(
             ('FBX', "FBX", "Export as FBX"),
             ('OBJ', "OBJ", "Export as OBJ"),
+            ('PLY', "PLY", "Export as binary PLY (positions, faces and vertex colors)"),
+            ('STL', "STL", "Export as binary STL (triangles only)"),
+            ('PC2', "PC2", "Export the topology once as OBJ plus one PC2 point cache with every frame"),
+            ('MDD', "MDD", "Export the topology once as OBJ plus one MDD point cache with every frame"),
+            ('ABC', "ABC", "Export every frame of the selected objects into one Alembic archive"),
+            ('USD', "USD", "Export one USD stage with the topology authored once and time-sampled points"),
+            ('GLB', "GLB", "Export one binary glTF with a sparse morph target per frame and a weights animation"),
         ),
         default='FBX',
     )
@@ -60,7 +147,7 @@ class ANIM_SEQ_OT_export_sequence(bpy.types.Operator, ExportHelper):
     # Export options
     export_mesh_only: BoolProperty(
         name="Mesh Only",
-        description="Export only mesh without bones",
+        description="Alembic only: export only the meshes, without armatures and other objects",
         default=True,
     )
 
@@ -77,6 +164,89 @@ class ANIM_SEQ_OT_export_sequence(bpy.types.Operator, ExportHelper):
         default=True,
     )
 
+    use_native_obj: BoolProperty(
+        name="Fast OBJ Writer",
+        description="Write OBJ frames with the built-in writer, which formats only the changing "
+                    "vertex data per frame. No materials or .mtl files are written",
+        default=False,
+    )
+
+    # Pipeline options (built-in writers only)
+    writer_threads: IntProperty(
+        name="Writer Threads",
+        description="Threads that format and write files while the next frames are evaluated "
+                    "(0 writes on the main thread)",
+        default=4,
+        min=0,
+        max=64,
+    )
+
+    queue_depth: IntProperty(
+        name="Queue Depth",
+        description="Maximum number of sampled frames waiting to be written; bounds memory use",
+        default=8,
+        min=1,
+        max=256,
+    )
+
+    # Incremental export
+    incremental: BoolProperty(
+        name="Skip Unchanged Frames",
+        description="Only rewrite frames whose evaluated geometry or export settings changed "
+                    "since the last export, according to the manifest next to the files",
+        default=False,
+    )
+
+    resume: BoolProperty(
+        name="Resume",
+        description="Continue an interrupted export: frames the progress journal lists as "
+                    "finished are not exported again",
+        default=False,
+    )
+
+    write_static_once: BoolProperty(
+        name="Write Static Objects Once",
+        description="Objects whose evaluated geometry and transform did not change since the previous "
+                    "exported frame are not written again; the manifest points the frame at the last written file",
+        default=False,
+    )
+
+    duplicate_frames: EnumProperty(
+        name="Duplicate Frames",
+        description="What to do with frames identical to an earlier frame of the same object (holds, cycles)",
+        items=(
+            ('WRITE', "Write", "Write every frame"),
+            ('HARDLINK', "Hard Link", "Hard link the frame to the earlier file (copied where links are unsupported), "
+                                      "so the numbered sequence stays complete"),
+            ('REFERENCE', "Manifest Reference", "Do not write the frame; the manifest points it at the earlier file"),
+        ),
+        default='WRITE',
+    )
+
+    # Sharded export
+    shard_count: IntProperty(
+        name="Background Processes",
+        description="Split the frame range across this many background Blender instances "
+                    "(0 or 1 exports in this session)",
+        default=0,
+        min=0,
+        max=64,
+    )
+
+    shard_label: StringProperty(
+        name="Shard Label",
+        description="Identifies the shard this export runs as (used by export shards)",
+        default="",
+        options={'HIDDEN', 'SKIP_SAVE'},
+    )
+
+    report_progress: BoolProperty(
+        name="Report Progress",
+        description="Print machine-readable progress lines (used by export shards)",
+        default=False,
+        options={'HIDDEN', 'SKIP_SAVE'},
+    )
+
     def invoke(self, context, event):
         # Set default frame range from scene
         self.frame_start = context.scene.frame_start
@@ -103,7 +273,7 @@ class ANIM_SEQ_OT_export_sequence(bpy.types.Operator, ExportHelper):
             os.makedirs(folder_path)
         
         # Determine extension based on format
-        ext = ".fbx" if self.file_format == 'FBX' else ".obj"
+        ext = FORMAT_EXTENSIONS[self.file_format]
         
         # Get base name from filepath or use default
         if self.filepath and self.filepath != "":
@@ -119,140 +289,798 @@ class ANIM_SEQ_OT_export_sequence(bpy.types.Operator, ExportHelper):
         end_frame = self.frame_end
         
         # Switch to object mode
-        bpy.ops.object.mode_set(mode='OBJECT')
+        if context.object and context.object.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
         
         # Store original selection
         original_selection = context.selected_objects.copy()
         original_active = context.active_object
         
+        # Only geometry can be evaluated to a mesh
+        objects = [obj for obj in original_selection if obj.type in GEOMETRY_TYPES]
+        
+        if self.file_format in POINT_CACHE_FORMATS:
+            return self.export_point_caches(context, objects, len(original_selection) == 1, folder_path, base_name)
+        if self.file_format == 'ABC':
+            return self.export_alembic(context, original_selection, objects, folder_path, base_name)
+        if self.file_format == 'USD':
+            return self.export_usd(context, objects, folder_path, base_name)
+        if self.file_format == 'GLB':
+            return self.export_gltf(context, objects, folder_path, base_name)
+        
+        # The manifest remembers what every file was written from
+        manifest_path = os.path.join(folder_path, base_name + MANIFEST_SUFFIX)
+        settings_hash = hash_settings(self.get_output_settings())
+        
+        # Files are written under a temporary name first; clear leftovers of
+        # a crashed run (shards leave this to the parent, which already did it)
+        if not self.shard_label:
+            remove_partial_files(folder_path, base_name)
+        
+        if self.shard_count > 1:
+            return self.export_sharded(context, original_selection, folder_path, base_name, manifest_path, settings_hash)
+        
+        # Frames finished by an interrupted run of this export
+        journal = ExportJournal(folder_path, base_name, self.shard_label, settings_hash)
+        completed = journal.load_completed() if self.resume else set()
+        journal.open(append=self.resume)
+        
+        manifest = ExportManifest(
+            manifest_path, settings_hash,
+            save_path=self.get_shard_manifest_path(manifest_path, self.shard_label) if self.shard_label else None,
+        )
+        
+        # Each object gets one proxy object that is exported with the
+        # evaluated mesh of every frame, so the scene itself is never touched.
+        # The built-in OBJ, PLY and STL writers need no proxies.
+        bpy.ops.object.select_all(action='DESELECT')
+        native_obj = self.file_format == 'OBJ' and self.use_native_obj
+        native = native_obj or self.file_format in BINARY_MESH_FORMATS
+        proxies = {}
+        obj_writers = {}
+        pipeline = WritePipeline(self.writer_threads if native else 0, self.queue_depth)
+        
+        sample_options = {
+            "with_colors": self.export_vertex_colors and (native_obj or self.file_format == 'PLY'),
+            "with_normals": native_obj,
+            "with_triangles": self.file_format == 'STL',
+        }
+        depsgraph = None
+        
+        # Content hash and file of the last frame written for each object
+        last_written = {}
+        # File first written for each (object, content hash), and duplicates to link to it
+        first_written = {}
+        pending_links = []
+        
         exported_count = 0
+        skipped_count = 0
+        referenced_count = 0
+        duplicate_count = 0
+        failed = False
         
-        # Iterate over all animation frames
-        for frame in range(start_frame, end_frame + 1, self.frame_step):
-            # Set current frame
-            bpy.context.scene.frame_set(frame)
+        try:
+            # Proxies are removed by the cleanup below, even if setup fails
+            if not native:
+                for obj in objects:
+                    proxies[obj] = self.create_export_proxy(context, obj)
             
-            # For each selected object
-            for obj in original_selection:
-                # Skip non-mesh objects if mesh only is enabled
-                if self.export_mesh_only and obj.type not in {'MESH', 'CURVE', 'SURFACE', 'FONT', 'META'}:
+            numeric_objects = self.get_numeric_evaluators(context, objects, sample_options)
+            # Frames only need evaluating for objects that are not sampled numerically
+            evaluate_scene = self.needs_scene(objects, numeric_objects)
+            
+            # Iterate over all animation frames
+            for frame in range(start_frame, end_frame + 1, self.frame_step):
+                # Frames a resumed run already finished are not evaluated again
+                if completed and all((obj.name, frame) in completed for obj in objects):
+                    skipped_count += len(objects)
+                    if self.report_progress:
+                        print(f"{PROGRESS_PREFIX} {frame}", flush=True)
                     continue
                 
-                # Select only this object
-                bpy.ops.object.select_all(action='DESELECT')
-                obj.select_set(True)
-                context.view_layer.objects.active = obj
+                # Set current frame
+                if evaluate_scene:
+                    context.scene.frame_set(frame)
+                    depsgraph = context.evaluated_depsgraph_get()
                 
-                # Store original type for reversion
-                original_type = obj.type
-                
-                # Convert to mesh if needed
-                if self.export_mesh_only and obj.type != 'MESH':
-                    try:
-                        bpy.ops.object.convert(target='MESH')
-                    except:
+                # For each selected object
+                for obj in objects:
+                    if (obj.name, frame) in completed:
+                        skipped_count += 1
                         continue
-                
-                # CRÍTICO: Crear una copia temporal del objeto para exportar
-                # Esto evita modificar el objeto original
-                bpy.ops.object.duplicate()
-                temp_obj = context.active_object
-                
-                # Aplicar todas las transformaciones a la copia
-                bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
-                
-                # Aplicar modificadores si está habilitado
-                if self.apply_modifiers:
-                    bpy.ops.object.convert(target='MESH')
-                
-                # Create unique filename for FBX/OBJ
-                if len(original_selection) == 1:
-                    filename = os.path.join(folder_path, f"{base_name}_{frame:04d}{ext}")
-                else:
-                    filename = os.path.join(folder_path, f"{base_name}_{obj.name}_{frame:04d}{ext}")
-                
-                # Remove invalid characters from filename
-                filename = filename.replace("*", "").replace("?", "").replace('"', "").replace("<", "").replace(">", "").replace("|", "")
-                
-                # Export based on format
-                try:
-                    if self.file_format == 'FBX':
-                        # Exportar FBX SIN animación horneada y SIN transformaciones embebidas
-                        bpy.ops.export_scene.fbx(
-                            filepath=filename,
-                            use_selection=True,
-                            apply_unit_scale=True,
-                            axis_forward='-Z',
-                            axis_up='Y',
-                            use_mesh_modifiers=False,  # Ya aplicamos modificadores antes
-                            bake_anim=False,  # CRÍTICO: No hornear animación
-                            bake_anim_use_all_bones=False,
-                            bake_anim_use_nla_strips=False,
-                            bake_anim_use_all_actions=False,
-                            bake_anim_force_startend_keying=True,
-                            apply_scale_options='FBX_SCALE_NONE',
-                            object_types={'MESH'},  # Solo exportar malla
-                            mesh_smooth_type='FACE',
-                            add_leaf_bones=False,  # Evitar huesos hoja vacíos
-                            use_armature_deform_only=True,
-                            primary_bone_axis='Y',
-                            secondary_bone_axis='X',
-                            use_space_transform=True,  # Exportar sin transformaciones de espacio
-                            global_scale=1.0,  # Escala 1:1
-                            use_custom_props=False  # No exportar propiedades personalizadas
-                        )
-                    else:  # OBJ
-                        # Exportar OBJ CON soporte de colores de vértice
-                        bpy.ops.wm.obj_export(
-                            filepath=filename,
-                            export_selected_objects=True,
-                            export_uv=True,
-                            export_normals=True,
-                            export_materials=True,
-                            export_colors=self.export_vertex_colors,  # ¡NUEVO: Exportar colores de vértice!
-                        )
                     
-                    exported_count += 1
+                    # Create unique filename for each object and frame
+                    if len(original_selection) == 1:
+                        filename = os.path.join(folder_path, f"{base_name}_{frame:04d}{ext}")
+                    else:
+                        filename = os.path.join(folder_path, f"{base_name}_{obj.name}_{frame:04d}{ext}")
+                    
+                    # Remove invalid characters from filename
+                    filename = clean_filename(filename)
+                    
+                    mesh = None
+                    if obj not in numeric_objects:
+                        mesh = self.create_frame_mesh(obj, depsgraph)
+                        if mesh is None:
+                            continue
                     
-                except Exception as e:
-                    print(f"Error exporting {obj.name} at frame {frame}: {str(e)}")
-                    import traceback
-                    traceback.print_exc()
-                
-                # Eliminar el objeto temporal
-                bpy.data.objects.remove(temp_obj, do_unlink=True)
-                
-                # Restaurar selección original
-                bpy.ops.object.select_all(action='DESELECT')
-                obj.select_set(True)
-                context.view_layer.objects.active = obj
-                
-                # Revert conversion if applied
-                if self.export_mesh_only and original_type != 'MESH':
                     try:
-                        bpy.ops.object.select_all(action='DESELECT')
-                        obj.select_set(True)
-                        context.view_layer.objects.active = obj
-                        bpy.ops.object.convert(target=original_type)
-                    except:
-                        pass
-        
-        # Restore original selection
-        bpy.ops.object.select_all(action='DESELECT')
-        for obj in original_selection:
-            if obj:  # Check if object still exists
-                obj.select_set(True)
+                        if mesh is None:
+                            evaluator, base_sample = numeric_objects[obj]
+                            sample = base_sample.with_positions(evaluator.positions(frame, depsgraph))
+                        else:
+                            sample = MeshSample(mesh, **sample_options)
+                        content_hash = sample.content_hash()
+                        
+                        # Positions are in world space, so the hash also covers the transform
+                        previous = last_written.get(obj)
+                        if self.write_static_once and previous and previous[0] == content_hash:
+                            manifest.record_reference(filename, previous[1], content_hash)
+                            journal.record(obj.name, frame, filename)
+                            if os.path.exists(filename):
+                                os.remove(filename)
+                            referenced_count += 1
+                            continue
+                        
+                        key = (obj.name, content_hash)
+                        if self.duplicate_frames != 'WRITE' and key in first_written:
+                            source = first_written[key]
+                            if self.duplicate_frames == 'REFERENCE':
+                                manifest.record_reference(filename, source, content_hash)
+                                journal.record(obj.name, frame, filename)
+                                if os.path.exists(filename):
+                                    os.remove(filename)
+                            else:
+                                # Linked once every queued write has finished
+                                pending_links.append((obj.name, frame, filename, source, content_hash))
+                            last_written[obj] = (content_hash, source)
+                            duplicate_count += 1
+                            continue
+                        
+                        if self.incremental and manifest.is_current(filename, content_hash):
+                            last_written[obj] = (content_hash, manifest.source_of(filename))
+                            first_written.setdefault(key, manifest.source_of(filename))
+                            skipped_count += 1
+                            continue
+                        last_written[obj] = (content_hash, filename)
+                        first_written.setdefault(key, filename)
+                        
+                        def on_success(name=obj.name, frame=frame, filename=filename, content_hash=content_hash):
+                            manifest.record(filename, content_hash)
+                            journal.record(name, frame, filename)
+                        
+                        if native_obj:
+                            # Only the array copies happen here; writing is queued
+                            self.queue_native_obj(pipeline, obj_writers, obj, sample, filename, on_success)
+                        elif native:
+                            self.queue_binary_mesh(pipeline, sample, filename, on_success)
+                        else:
+                            write_atomic(filename, self.export_mesh, context, proxies[obj], mesh)
+                            on_success()
+                            exported_count += 1
+                    except Exception as e:
+                        failed = True
+                        print(f"Error exporting {obj.name} at frame {frame}: {str(e)}")
+                        import traceback
+                        traceback.print_exc()
+                    finally:
+                        # Free the frame's mesh right away
+                        if mesh is not None:
+                            bpy.data.meshes.remove(mesh)
+                
+                if self.report_progress:
+                    print(f"{PROGRESS_PREFIX} {frame}", flush=True)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            pipeline.close()
+            exported_count += pipeline.completed
+            failed = failed or pipeline.failed > 0
+            
+            for name, frame, filename, source, content_hash in pending_links:
+                try:
+                    link_atomic(filename, source)
+                    manifest.record(filename, content_hash)
+                    journal.record(name, frame, filename)
+                except OSError as e:
+                    failed = True
+                    duplicate_count -= 1
+                    print(f"Error linking {filename} to {source}: {e}")
+            
+            try:
+                manifest.save(only_records=bool(self.shard_label))
+            except OSError as e:
+                print(f"Error writing export manifest {manifest.save_path}: {e}")
+            
+            # Keep the journal around only while there is something to resume
+            if failed or self.shard_label:
+                journal.close()
+            else:
+                journal.remove_all()
+            
+            for proxy in proxies.values():
+                self.remove_export_proxy(proxy)
+            
+            # Restore original selection
+            for obj in original_selection:
+                if obj:  # Check if object still exists
+                    obj.select_set(True)
+            
+            if original_active:
+                context.view_layer.objects.active = original_active
         
-        if original_active:
-            context.view_layer.objects.active = original_active
+        if self.report_progress:
+            print(f"{DONE_PREFIX} {exported_count}", flush=True)
         
-        if exported_count > 0:
+        if skipped_count > 0 or referenced_count > 0 or duplicate_count > 0:
+            details = []
+            if skipped_count:
+                details.append(f"{skipped_count} unchanged or already exported skipped")
+            if referenced_count:
+                details.append(f"{referenced_count} static frames referenced in the manifest")
+            if duplicate_count:
+                verb = "linked" if self.duplicate_frames == 'HARDLINK' else "referenced in the manifest"
+                details.append(f"{duplicate_count} duplicate frames {verb}")
+            self.report({'INFO'}, f"Export completed: {exported_count} files to {folder_path}, {', '.join(details)}")
+            return {'FINISHED'}
+        elif exported_count > 0:
             self.report({'INFO'}, f"Export completed: {exported_count} files to {folder_path}")
             return {'FINISHED'}
         else:
             self.report({'ERROR'}, "No files exported")
             return {'CANCELLED'}
 
+    def export_point_caches(self, context, objects, single, folder_path, base_name):
+        """Write each object's topology once and all of its frames into one point cache"""
+        frames = range(self.frame_start, self.frame_end + 1, self.frame_step)
+        ext = FORMAT_EXTENSIONS[self.file_format]
+        writers = {}
+        exported_count = 0
+        finished = False
+        numeric_objects = {}
+        # Topology OBJ written for each object, removed again with its cache
+        topology_paths = {}
+
+        try:
+            for index, frame in enumerate(frames):
+                # The first frame also writes the topology files, so numeric
+                # evaluation starts once it has been evaluated
+                if index == 1:
+                    numeric_objects = self.get_numeric_evaluators(context, objects)
+                if index == 0 or self.needs_scene(objects, numeric_objects):
+                    context.scene.frame_set(frame)
+                    depsgraph = context.evaluated_depsgraph_get()
+
+                for obj in objects:
+                    if index > 0 and writers.get(obj) is None:
+                        continue  # Failed on an earlier frame
+
+                    if index > 0 and obj in numeric_objects:
+                        evaluator, _sample = numeric_objects[obj]
+                        writers[obj].write_frame(to_obj_axes(evaluator.positions(frame, depsgraph)))
+                        continue
+
+                    mesh = self.create_frame_mesh(obj, depsgraph)
+                    if mesh is None:
+                        writers[obj] = None
+                        continue
+
+                    try:
+                        positions = get_vertex_positions(mesh)
+                        if index == 0:
+                            # The topology file uses the same axes as the cached points
+                            stem = base_name if single else f"{base_name}_{obj.name}"
+                            topology_path = clean_filename(os.path.join(folder_path, stem + ".obj"))
+                            sample = MeshSample(mesh, with_colors=self.export_vertex_colors, with_normals=True)
+                            topology_writer = ObjSequenceWriter(
+                                obj.name, sample.polygon_sizes, sample.corner_verts, sample.corner_uvs,
+                            )
+                            write_atomic(topology_path, topology_writer.write, positions, sample.normals, sample.colors)
+                            topology_paths[obj] = topology_path
+
+                            cache_path = clean_filename(os.path.join(folder_path, stem + ext))
+                            writers[obj] = PointCacheWriter(
+                                partial_path(cache_path), self.file_format, len(mesh.vertices), len(frames),
+                                frame_start=self.frame_start, frame_step=self.frame_step,
+                                fps=context.scene.render.fps / context.scene.render.fps_base,
+                            )
+                            writers[obj].final_path = cache_path
+                            exported_count += 1
+
+                        writers[obj].write_frame(to_obj_axes(positions))
+                    except Exception as e:
+                        print(f"Error exporting {obj.name} at frame {frame}: {str(e)}")
+                        writer = writers.pop(obj, None)
+                        if writer:
+                            writer.close()
+                            os.remove(writer.filepath)
+                            exported_count -= 1
+                        topology_path = topology_paths.pop(obj, None)
+                        if topology_path and os.path.exists(topology_path):
+                            os.remove(topology_path)
+                        writers[obj] = None
+                    finally:
+                        bpy.data.meshes.remove(mesh)
+
+                if self.report_progress:
+                    print(f"{PROGRESS_PREFIX} {frame}", flush=True)
+            finished = True
+        finally:
+            # Only complete caches are moved into place
+            for writer in writers.values():
+                if writer is None:
+                    continue
+                writer.close()
+                if finished:
+                    os.replace(writer.filepath, writer.final_path)
+                else:
+                    os.remove(writer.filepath)
+            if not finished:
+                for topology_path in topology_paths.values():
+                    if os.path.exists(topology_path):
+                        os.remove(topology_path)
+
+        if exported_count > 0:
+            self.report({'INFO'}, f"Export completed: {exported_count} {self.file_format} caches of {len(frames)} frames to {folder_path}")
+            return {'FINISHED'}
+        else:
+            self.report({'ERROR'}, "No files exported")
+            return {'CANCELLED'}
+
+    def export_alembic(self, context, selection, objects, folder_path, base_name):
+        """Write the frame range of the selection into one Alembic archive"""
+        if not objects:
+            self.report({'ERROR'}, "No files exported")
+            return {'CANCELLED'}
+
+        # Alembic samples every frame; it has no way to skip frames
+        frame_count = self.frame_end - self.frame_start + 1
+        if self.frame_step > 1:
+            self.report({'WARNING'}, f"Alembic cannot skip frames, exporting all {frame_count} frames (step ignored)")
+
+        filename = clean_filename(os.path.join(folder_path, base_name + ".abc"))
+        exported = objects if self.export_mesh_only else selection
+
+        # Without applied modifiers the archive stores the undeformed meshes
+        disabled = []
+        if not self.apply_modifiers:
+            for obj in objects:
+                for modifier in obj.modifiers:
+                    if modifier.show_viewport:
+                        modifier.show_viewport = False
+                        disabled.append(modifier)
+
+        bpy.ops.object.select_all(action='DESELECT')
+        for obj in exported:
+            obj.select_set(True)
+
+        try:
+            write_atomic(
+                filename,
+                lambda path: bpy.ops.wm.alembic_export(
+                    filepath=path,
+                    start=self.frame_start,
+                    end=self.frame_end,
+                    selected=True,
+                    flatten=True,
+                    uvs=True,
+                    normals=True,
+                    vcolors=self.export_vertex_colors,
+                    evaluation_mode='VIEWPORT',
+                    as_background_job=False,
+                ),
+            )
+        except RuntimeError as e:
+            self.report({'ERROR'}, f"Alembic export failed: {e}")
+            return {'CANCELLED'}
+        finally:
+            for modifier in disabled:
+                modifier.show_viewport = True
+
+            bpy.ops.object.select_all(action='DESELECT')
+            for obj in selection:
+                if obj:
+                    obj.select_set(True)
+
+        # Same count as the per-frame formats: one per object and frame
+        exported_count = frame_count * len(objects)
+        self.report({'INFO'}, f"Export completed: {exported_count} frames of {len(objects)} objects to {filename}")
+        return {'FINISHED'}
+
+    def export_usd(self, context, objects, folder_path, base_name):
+        """Write the evaluated meshes of the frame range into one USD stage"""
+        if not usd_available():
+            self.report({'ERROR'}, "USD export needs a Blender build with USD support (pxr module)")
+            return {'CANCELLED'}
+
+        frames = range(self.frame_start, self.frame_end + 1, self.frame_step)
+        filename = clean_filename(os.path.join(folder_path, base_name + ".usd"))
+        scene = context.scene
+        exported_count = 0
+
+        if not objects or not frames:
+            self.report({'ERROR'}, "No files exported")
+            return {'CANCELLED'}
+
+        numeric_objects = self.get_numeric_evaluators(context, objects)
+        evaluate_scene = self.needs_scene(objects, numeric_objects)
+
+        def write_stage(path):
+            nonlocal exported_count
+            writer = UsdSequenceWriter(path, frames[0], frames[-1], scene.render.fps / scene.render.fps_base)
+            # Stays None when only numeric evaluators are exported
+            depsgraph = None
+
+            for frame in frames:
+                if evaluate_scene:
+                    scene.frame_set(frame)
+                    depsgraph = context.evaluated_depsgraph_get()
+
+                for obj in objects:
+                    mesh = None
+                    if obj in numeric_objects:
+                        evaluator, sample = numeric_objects[obj]
+                        polygon_sizes, corner_verts, corner_uvs = sample.polygon_sizes, sample.corner_verts, sample.corner_uvs
+                        positions = evaluator.positions(frame, depsgraph)
+                    else:
+                        mesh = self.create_frame_mesh(obj, depsgraph)
+                        if mesh is None:
+                            continue
+                        polygon_sizes, corner_verts, corner_uvs = get_topology(mesh)
+                        positions = get_vertex_positions(mesh)
+
+                    try:
+                        if not writer.has_mesh(obj.name):
+                            writer.add_mesh(obj.name, frame, polygon_sizes, corner_verts, corner_uvs)
+                        writer.write_frame(obj.name, frame, positions, polygon_sizes, corner_verts)
+                        exported_count += 1
+                    finally:
+                        if mesh is not None:
+                            bpy.data.meshes.remove(mesh)
+
+                if self.report_progress:
+                    print(f"{PROGRESS_PREFIX} {frame}", flush=True)
+
+            writer.save()
+
+        try:
+            write_atomic(filename, write_stage)
+        except Exception as e:
+            self.report({'ERROR'}, f"USD export failed: {e}")
+            return {'CANCELLED'}
+
+        if exported_count > 0:
+            self.report({'INFO'}, f"Export completed: {exported_count} frames of {len(objects)} objects to {filename}")
+            return {'FINISHED'}
+        else:
+            self.report({'ERROR'}, "No files exported")
+            return {'CANCELLED'}
+
+    def export_gltf(self, context, objects, folder_path, base_name):
+        """Write every exported frame as a morph target into one GLB"""
+        frames = range(self.frame_start, self.frame_end + 1, self.frame_step)
+        if not objects or not frames:
+            self.report({'ERROR'}, "No files exported")
+            return {'CANCELLED'}
+
+        filename = clean_filename(os.path.join(folder_path, base_name + ".glb"))
+        scene = context.scene
+        fps = scene.render.fps / scene.render.fps_base
+        writer = GltfMorphWriter()
+        handles = {}
+        exported_count = 0
+
+        # Imported shapekey sequences are read directly, without evaluating the scene
+        keyed = {}
+        for obj in objects:
+            key_blocks = self.get_frame_shapekeys(obj, frames)
+            if key_blocks is not None:
+                keyed[obj] = key_blocks
+
+        for obj, key_blocks in keyed.items():
+            basis = transform_positions(get_shapekey_positions(obj.data.shape_keys.reference_key), obj.matrix_world)
+            handles[obj] = writer.add_mesh(obj.name, to_obj_axes(basis), get_triangles(obj.data))
+            for frame, key_block in zip(frames, key_blocks):
+                positions = transform_positions(get_shapekey_positions(key_block), obj.matrix_world)
+                writer.add_target(handles[obj], key_block.name, (frame - frames[0]) / fps, to_obj_axes(positions))
+                exported_count += 1
+
+        evaluated = [obj for obj in objects if obj not in keyed]
+        for frame in frames if evaluated else ():
+            scene.frame_set(frame)
+            depsgraph = context.evaluated_depsgraph_get()
+
+            for obj in evaluated:
+                mesh = self.create_frame_mesh(obj, depsgraph)
+                if mesh is None:
+                    continue
+
+                try:
+                    positions = to_obj_axes(get_vertex_positions(mesh))
+                    if obj not in handles:
+                        handles[obj] = writer.add_mesh(obj.name, positions, get_triangles(mesh))
+                    writer.add_target(handles[obj], f"Frame_{frame:04d}", (frame - frames[0]) / fps, positions)
+                    exported_count += 1
+                except ValueError as e:
+                    print(f"Error exporting {obj.name} at frame {frame}: {str(e)}")
+                finally:
+                    bpy.data.meshes.remove(mesh)
+
+            if self.report_progress:
+                print(f"{PROGRESS_PREFIX} {frame}", flush=True)
+
+        if exported_count == 0:
+            self.report({'ERROR'}, "No files exported")
+            return {'CANCELLED'}
+
+        try:
+            write_atomic(filename, writer.write)
+        except OSError as e:
+            self.report({'ERROR'}, f"Failed to write {filename}: {e}")
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Export completed: {exported_count} frames of {len(handles)} objects to {filename}")
+        return {'FINISHED'}
+
+    def get_frame_shapekeys(self, obj, frames):
+        """Return the Frame_XXXX shapekeys that show each frame, or None if obj needs evaluating
+
+        Only objects deformed by nothing but an imported shapekey sequence
+        qualify; imports show key Frame_(N + 1) at frame N.
+        """
+        if not supports_shapekey_eval(obj):
+            return None
+
+        key_blocks = obj.data.shape_keys.key_blocks
+        frame_keys = [key_blocks.get(f"Frame_{frame + 1:04d}") for frame in frames]
+        if any(key_block is None for key_block in frame_keys):
+            return None
+        return frame_keys
+
+    def get_numeric_evaluators(self, context, objects, sample_options=None):
+        """Return {obj: (evaluator, sample)} for objects whose frames can be computed in numpy
+
+        Covers shapekey-only and armature-only deformation. Each evaluator
+        must reproduce the evaluated mesh of the current frame, and sample
+        holds the object's topology for the writers. Armature modifiers stay
+        on, since other objects may depend on the deformed mesh.
+        """
+        if not self.apply_modifiers or self.file_format not in NUMERIC_EVAL_FORMATS:
+            return {}
+
+        depsgraph = context.evaluated_depsgraph_get()
+        evaluators = {}
+        for obj in objects:
+            modifier = get_skinning_modifier(obj)
+            if modifier is None and not supports_shapekey_eval(obj):
+                continue
+
+            mesh = self.create_frame_mesh(obj, depsgraph)
+            if mesh is None:
+                continue
+
+            try:
+                evaluator = ArmatureSkinning(obj, modifier) if modifier else ShapeKeyEvaluator(obj)
+                sample = MeshSample(mesh, **(sample_options or {}))
+                positions = evaluator.positions(context.scene.frame_current, depsgraph)
+                if np.allclose(positions, sample.positions, atol=1e-4):
+                    evaluators[obj] = (evaluator, sample)
+                else:
+                    print(f"{obj.name} does not match its numeric evaluation, evaluating the scene instead")
+            finally:
+                bpy.data.meshes.remove(mesh)
+
+        return evaluators
+
+    def needs_scene(self, objects, evaluators):
+        """Check whether any object needs the scene evaluated at each frame"""
+        return any(obj not in evaluators or evaluators[obj][0].needs_scene for obj in objects)
+
+    def get_output_settings(self):
+        """Settings that change the content of the written files"""
+        return {
+            "file_format": self.file_format,
+            "apply_modifiers": self.apply_modifiers,
+            "export_vertex_colors": self.export_vertex_colors,
+            "use_native_obj": self.use_native_obj,
+            "write_static_once": self.write_static_once,
+            "duplicate_frames": self.duplicate_frames,
+        }
+
+    def get_shard_manifest_path(self, manifest_path, label):
+        return manifest_path[:-len(".json")] + f".{label}.json"
+
+    def export_sharded(self, context, selection, folder_path, base_name, manifest_path, settings_hash):
+        """Export the frame range as shards in background Blender instances"""
+        shards = split_frames(self.frame_start, self.frame_end, self.frame_step, self.shard_count)
+        if not shards:
+            self.report({'ERROR'}, "No frames to export")
+            return {'CANCELLED'}
+
+        # A fresh run must not pick up journals of an earlier one
+        if not self.resume:
+            ExportJournal(folder_path, base_name).remove_all()
+
+        # Shards need the current state of the scene on disk
+        temp_dir = None
+        blend_path = bpy.data.filepath
+        if not blend_path or bpy.data.is_dirty:
+            temp_dir = tempfile.mkdtemp(prefix="anim_seq_")
+            blend_path = os.path.join(temp_dir, os.path.basename(blend_path) or "export.blend")
+            bpy.ops.wm.save_as_mainfile(filepath=blend_path, copy=True)
+
+        # Every shard runs this operator with the same settings on its own range
+        settings = {
+            prop.identifier: getattr(self, prop.identifier)
+            for prop in self.properties.bl_rna.properties
+            if prop.identifier != "rna_type" and not prop.is_readonly
+        }
+        settings.update(
+            filepath=bpy.path.abspath(self.filepath),
+            shard_count=0,
+            report_progress=True,
+            object_names=[obj.name for obj in selection],
+        )
+
+        commands = []
+        shard_labels = []
+        for index, (start, end) in enumerate(shards):
+            shard_labels.append(f"shard{index:03d}")
+            settings.update(frame_start=start, frame_end=end, shard_label=shard_labels[-1])
+            script = SHARD_SCRIPT.format(module=ADDON_MODULE, settings=json.dumps(settings))
+            commands.append([
+                bpy.app.binary_path, "-b", blend_path,
+                "--python-exit-code", "1", "--python-expr", script,
+            ])
+
+        frame_count = len(range(self.frame_start, self.frame_end + 1, self.frame_step))
+        wm = context.window_manager
+        wm.progress_begin(0, frame_count)
+        try:
+            results = run_shards(commands, wm.progress_update)
+        finally:
+            wm.progress_end()
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+
+        # Every shard recorded its own frames; fold them into one manifest
+        shard_manifests = [self.get_shard_manifest_path(manifest_path, label) for label in shard_labels]
+        manifest = ExportManifest(manifest_path, settings_hash)
+        manifest.merge(shard_manifests)
+        try:
+            manifest.save()
+        except OSError as e:
+            print(f"Error writing export manifest {manifest_path}: {e}")
+        for path in shard_manifests:
+            if os.path.exists(path):
+                os.remove(path)
+
+        # Shard journals are only needed to resume a failed run
+        if not any(code != 0 for code, _count in results):
+            ExportJournal(folder_path, base_name).remove_all()
+
+        exported_count = sum(count for _code, count in results)
+        failed = sum(1 for code, _count in results if code != 0)
+
+        if failed:
+            self.report({'WARNING'}, f"{failed} of {len(shards)} shards failed; {exported_count} files exported to {folder_path}")
+        elif exported_count > 0 or self.incremental:
+            self.report({'INFO'}, f"Export completed: {exported_count} files to {folder_path} ({len(shards)} shards)")
+        else:
+            self.report({'ERROR'}, "No files exported")
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+    def create_export_proxy(self, context, obj):
+        """Create the object that stands in for obj in the exporters
+
+        The proxy holds an empty placeholder mesh between frames.
+        """
+        proxy = bpy.data.objects.new(obj.name, bpy.data.meshes.new(obj.name))
+        context.scene.collection.objects.link(proxy)
+        return proxy
+
+    def remove_export_proxy(self, proxy):
+        placeholder = proxy.data
+        bpy.data.objects.remove(proxy, do_unlink=True)
+        bpy.data.meshes.remove(placeholder)
+
+    def create_frame_mesh(self, obj, depsgraph):
+        """Evaluate obj at the current frame into a world-space temporary mesh"""
+        try:
+            if self.apply_modifiers:
+                eval_obj = obj.evaluated_get(depsgraph)
+                mesh = bpy.data.meshes.new_from_object(
+                    eval_obj, preserve_all_data_layers=True, depsgraph=depsgraph)
+            else:
+                eval_obj = obj
+                mesh = bpy.data.meshes.new_from_object(obj)
+        except RuntimeError as e:
+            print(f"Error evaluating {obj.name}: {e}")
+            return None
+
+        mesh.transform(eval_obj.matrix_world)
+        if eval_obj.matrix_world.is_negative:
+            mesh.flip_normals()
+        return mesh
+
+    def export_mesh(self, filename, context, proxy, mesh):
+        """Export a frame mesh through its proxy object with the selected format"""
+        placeholder = proxy.data
+        proxy.data = mesh
+        proxy.select_set(True)
+        context.view_layer.objects.active = proxy
+
+        try:
+            if self.file_format == 'FBX':
+                # Exportar FBX SIN animación horneada y SIN transformaciones embebidas
+                bpy.ops.export_scene.fbx(
+                    filepath=filename,
+                    use_selection=True,
+                    apply_unit_scale=True,
+                    axis_forward='-Z',
+                    axis_up='Y',
+                    use_mesh_modifiers=False,  # Ya aplicamos modificadores antes
+                    bake_anim=False,  # CRÍTICO: No hornear animación
+                    bake_anim_use_all_bones=False,
+                    bake_anim_use_nla_strips=False,
+                    bake_anim_use_all_actions=False,
+                    bake_anim_force_startend_keying=True,
+                    apply_scale_options='FBX_SCALE_NONE',
+                    object_types={'MESH'},  # Solo exportar malla
+                    mesh_smooth_type='FACE',
+                    add_leaf_bones=False,  # Evitar huesos hoja vacíos
+                    use_armature_deform_only=True,
+                    primary_bone_axis='Y',
+                    secondary_bone_axis='X',
+                    use_space_transform=True,  # Exportar sin transformaciones de espacio
+                    global_scale=1.0,  # Escala 1:1
+                    use_custom_props=False  # No exportar propiedades personalizadas
+                )
+            else:  # OBJ
+                # Exportar OBJ CON soporte de colores de vértice
+                bpy.ops.wm.obj_export(
+                    filepath=filename,
+                    export_selected_objects=True,
+                    apply_modifiers=False,
+                    export_uv=True,
+                    export_normals=True,
+                    export_materials=True,
+                    export_colors=self.export_vertex_colors,  # ¡NUEVO: Exportar colores de vértice!
+                )
+                # The exporter named the .mtl after the partial file
+                rename_partial_mtl(filename)
+        finally:
+            proxy.select_set(False)
+            proxy.data = placeholder
+
+    def queue_native_obj(self, pipeline, writers, obj, sample, filename, on_success=None):
+        """Queue a frame's arrays for the built-in OBJ writer
+
+        The writer caches the faces and UVs of the first frame and is only
+        rebuilt when the topology changes.
+        """
+        writer = writers.get(obj)
+        if writer is None or not writer.matches(sample.polygon_sizes, sample.corner_verts):
+            writer = writers[obj] = ObjSequenceWriter(
+                obj.name, sample.polygon_sizes, sample.corner_verts, sample.corner_uvs)
+
+        pipeline.submit(
+            os.path.basename(filename), write_atomic,
+            filename, writer.write, sample.positions, sample.normals, sample.colors,
+            on_success=on_success,
+        )
+
+    def queue_binary_mesh(self, pipeline, sample, filename, on_success=None):
+        """Queue a frame's arrays for the binary PLY or STL writer"""
+        if self.file_format == 'STL':
+            args = (write_stl, sample.positions, sample.triangles)
+        else:
+            args = (write_ply, sample.positions, sample.polygon_sizes, sample.corner_verts, sample.colors)
+
+        pipeline.submit(os.path.basename(filename), write_atomic, filename, *args, on_success=on_success)
+
     def draw(self, context):
         layout = self.layout
         
@@ -268,15 +1096,33 @@ class ANIM_SEQ_OT_export_sequence(bpy.types.Operator, ExportHelper):
         row.prop(self, "frame_end")
         layout.prop(self, "frame_step")
         
+        if self.file_format == 'ABC' and self.frame_step > 1:
+            layout.label(text="Alembic exports every frame", icon='ERROR')
+        
+        # Per-frame file options
+        if self.file_format not in POINT_CACHE_FORMATS | ARCHIVE_FORMATS:
+            layout.prop(self, "shard_count")
+            layout.prop(self, "incremental")
+            layout.prop(self, "resume")
+            layout.prop(self, "write_static_once")
+            layout.prop(self, "duplicate_frames")
+        
         # Export options
         layout.separator()
         layout.label(text="Export Options:")
-        layout.prop(self, "export_mesh_only")
+        if self.file_format == 'ABC':
+            layout.prop(self, "export_mesh_only")
         layout.prop(self, "apply_modifiers")
         
-        # Vertex colors option (only for OBJ format)
-        if self.file_format == 'OBJ':
+        # Vertex colors option (only for OBJ based formats)
+        if self.file_format not in {'FBX', 'STL', 'USD', 'GLB'}:
             layout.prop(self, "export_vertex_colors")
+        if self.file_format == 'OBJ':
+            layout.prop(self, "use_native_obj")
+        if (self.file_format == 'OBJ' and self.use_native_obj) or self.file_format in BINARY_MESH_FORMATS:
+            row = layout.row(align=True)
+            row.prop(self, "writer_threads")
+            row.prop(self, "queue_depth")
 
 
 def register():
@@ -0,0 +1,24 @@
+import bpy
+
+from ..utils.stream_playback import frame_lru
+
+
+class ANIM_SEQ_OT_clear_frame_cache(bpy.types.Operator):
+    """Free the decoded frames of streamed sequences and reset the hit/miss counters"""
+
+    bl_idname = "anim_seq.clear_frame_cache"
+    bl_label = "Clear Frame Cache"
+
+    def execute(self, context):
+        frame_lru.clear()
+        frame_lru.reset_stats()
+        self.report({'INFO'}, "Frame cache cleared")
+        return {'FINISHED'}
+
+
+def register():
+    bpy.utils.register_class(ANIM_SEQ_OT_clear_frame_cache)
+
+
+def unregister():
+    bpy.utils.unregister_class(ANIM_SEQ_OT_clear_frame_cache)
@@ -1,25 +1,41 @@
 import bpy
+import os
 from pathlib import Path
 from bpy.props import (
     BoolProperty,
     CollectionProperty,
+    IntProperty,
     StringProperty,
     EnumProperty,
 )
 from bpy_extras.io_utils import ImportHelper
 
-from ..utils.mesh_utils import extract_number, import_mesh_file
+from ..utils.anim_utils import ensure_action, set_keyframes
+from ..utils.mesh_utils import (
+    extract_number,
+    import_mesh_file,
+    native_reader_matches,
+    iter_vertex_positions,
+    add_shapekey_from_positions,
+    set_vertex_colors,
+    get_vertex_positions,
+    get_cache_path,
+    get_topology,
+)
+from ..utils.frame_cache import FrameCacheReader, FrameCacheWriter, is_cache_file
+from ..utils.point_cache import PointCacheReader, point_cache_format
+from ..utils.stream_playback import CACHE_PATH_PROP, FRAME_START_PROP, apply_cached_frame
 
 
 class ANIM_SEQ_OT_import_sequence(bpy.types.Operator, ImportHelper):
-    """Import a mesh sequence (FBX/OBJ) as shapekeys or separate objects"""
+    """Import a mesh sequence (FBX/OBJ/PLY/STL) as shapekeys or separate objects"""
     
     bl_idname = "import_scene.meshseq"
     bl_label = "Import Mesh Sequence"
     bl_options = {"REGISTER", "UNDO"}
 
     filename_ext = ".*"
-    filter_glob: StringProperty(default="*.fbx;*.obj", options={"HIDDEN"})
+    filter_glob: StringProperty(default="*.fbx;*.obj;*.ply;*.stl;*.animseq;*.pc2;*.mdd", options={"HIDDEN"})
 
     files: CollectionProperty(
         name="File Path",
@@ -63,16 +79,52 @@ class ANIM_SEQ_OT_import_sequence(bpy.types.Operator, ImportHelper):
         items=[
             ('SHAPEKEYS', "ShapeKeys", "Import as ShapeKeys in a single object (no vertex colors)"),
             ('SEPARATE', "Separate Objects", "Import each frame as separate object (with vertex colors)"),
+            ('STREAM', "Streamed Cache", "Write frames to an on-disk cache and load only the current frame during playback"),
         ],
         default='SHAPEKEYS',
     )
 
     relative_shapekey: BoolProperty(
         name="Relative ShapeKeys",
-        description="Import shapekeys as relative",
+        description="Import shapekeys as relative, each with its own fcurve. "
+                    "When disabled, a single Evaluation Time fcurve steps through absolute shapekeys",
         default=True,
     )
 
+    eval_time_interpolation: EnumProperty(
+        name="Frame Blending",
+        description="How the Evaluation Time fcurve moves between frames",
+        items=[
+            ('CONSTANT', "Constant", "Show exactly one frame at a time"),
+            ('LINEAR', "Linear", "Blend the two neighbouring frames on subframes"),
+        ],
+        default='LINEAR',
+    )
+
+    point_cache_setup: EnumProperty(
+        name="Point Cache",
+        description="How a selected PC2/MDD file animates the base mesh",
+        items=[
+            ('MODIFIER', "Mesh Cache Modifier", "Read the cache during playback with a Mesh Cache modifier"),
+            ('SHAPEKEYS', "ShapeKeys", "Bake every cached frame into a shapekey"),
+        ],
+        default='MODIFIER',
+    )
+
+    use_parallel: BoolProperty(
+        name="Parallel Parsing",
+        description="Parse OBJ frames in worker processes; the main thread only writes mesh data",
+        default=False,
+    )
+
+    worker_count: IntProperty(
+        name="Workers",
+        description="Number of worker processes used to parse frames",
+        default=max(1, (os.cpu_count() or 2) - 1),
+        min=1,
+        max=64,
+    )
+
     def draw(self, context):
         layout = self.layout
         
@@ -88,8 +140,20 @@ class ANIM_SEQ_OT_import_sequence(bpy.types.Operator, ImportHelper):
         layout.separator()
         layout.prop(self, "import_method")
         
-        if self.import_method == 'SHAPEKEYS':
+        # A selected .pc2/.mdd file uses its own setup instead of the import method
+        if any(point_cache_format(f.name) for f in self.files) or point_cache_format(self.filename):
+            layout.prop(self, "point_cache_setup")
+            uses_shapekeys = self.point_cache_setup == 'SHAPEKEYS'
+        else:
+            uses_shapekeys = self.import_method == 'SHAPEKEYS'
+        if uses_shapekeys:
             layout.prop(self, "relative_shapekey")
+            if not self.relative_shapekey:
+                layout.prop(self, "eval_time_interpolation")
+
+        layout.prop(self, "use_parallel")
+        if self.use_parallel:
+            layout.prop(self, "worker_count")
 
     def execute(self, context):
         filepaths = [Path(self.directory, f.name) for f in self.files]
@@ -97,14 +161,36 @@ class ANIM_SEQ_OT_import_sequence(bpy.types.Operator, ImportHelper):
             filepaths.append(Path(self.directory, self.filename))
 
         filepaths.sort(key=extract_number)
+
+        # A point cache animates a base mesh picked with it or sitting next to it
+        point_caches = [filepath for filepath in filepaths if point_cache_format(filepath)]
+        if point_caches:
+            base_paths = [filepath for filepath in filepaths if not point_cache_format(filepath)]
+            if not base_paths:
+                base_paths = [
+                    point_caches[0].with_suffix(ext) for ext in (".obj", ".fbx")
+                    if point_caches[0].with_suffix(ext).exists()
+                ]
+            if not base_paths:
+                self.report({'ERROR'}, f"Select the base mesh together with {point_caches[0].name}")
+                return {"CANCELLED"}
+            filepaths = base_paths[:1]
+
+        # A frame cache already holds the whole sequence
+        if is_cache_file(filepaths[0]):
+            filepaths = filepaths[:1]
         
         # Create collection if enabled
         collection = None
         if self.create_collection:
             collection = self.create_sequence_collection(context)
         
-        if self.import_method == 'SEPARATE':
+        if point_caches:
+            return self.import_point_cache(filepaths[0], point_caches[0], collection, context)
+        elif self.import_method == 'SEPARATE':
             return self.import_as_separate_objects(filepaths, collection, context)
+        elif self.import_method == 'STREAM':
+            return self.import_as_stream(filepaths, collection, context)
         else:
             return self.create_shapekeys(filepaths, collection, context)
 
@@ -138,66 +224,221 @@ class ANIM_SEQ_OT_import_sequence(bpy.types.Operator, ImportHelper):
             return {"CANCELLED"}
 
         # Import first file
-        main_obj = import_mesh_file(filepaths[0])
+        main_obj = self.import_base_object(filepaths[0], collection, context)
         if not main_obj:
             self.report({'ERROR'}, f"Failed to import {filepaths[0]}")
             return {"CANCELLED"}
 
-        main_obj.location = (0, 0, 0)
-        main_obj.rotation_euler = (0, 0, 0)  
-
-        # Move to collection if it exists
-        if collection:
-            self.move_to_collection(main_obj, collection, context)
-            main_obj.name = f"{self.collection_name}_Base"
-
         if not main_obj.data.shape_keys:
             main_obj.shape_key_add(name="Basis")
 
-        # Import the rest as shapekeys
-        for filepath in filepaths[1:]:
-            current_obj = import_mesh_file(filepath)
-            if not current_obj:
+        # Import the rest as shapekeys, writing positions straight into each key
+        skipped = 0
+        for filepath, coords, _colors in self.iter_frames(filepaths, main_obj.data):
+            if coords is None:
+                skipped += 1
                 continue
-                
-            current_obj.location = (0, 0, 0)
-            current_obj.rotation_euler = (0, 0, 0) 
 
-            context.view_layer.objects.active = main_obj
-            bpy.ops.object.join_shapes()
-            bpy.data.objects.remove(current_obj, do_unlink=True)
+            key_index = len(main_obj.data.shape_keys.key_blocks)
+            add_shapekey_from_positions(main_obj, f"Frame_{key_index:04d}", coords)
+
+        main_obj.data.update()
 
         # Count shapekeys (excluding Basis)
         shapekey_count = len(main_obj.data.shape_keys.key_blocks) - 1
-        
-        # Name shapekeys according to the frame
-        for i, key_block in enumerate(main_obj.data.shape_keys.key_blocks):
-            if key_block.name == "Basis":
-                continue
-            key_block.name = f"Frame_{i:04d}"
 
         # Animate shapekeys
         if shapekey_count > 0:
-            for i, key_block in enumerate(main_obj.data.shape_keys.key_blocks):
-                if key_block.name == "Basis":
-                    continue
-                
-                anim_index = i - 1
-                
-                key_block.value = 0.0
-                key_block.keyframe_insert("value", frame=anim_index - 1)
-                key_block.value = 1.0
-                key_block.keyframe_insert("value", frame=anim_index)
-                key_block.value = 0.0
-                key_block.keyframe_insert("value", frame=anim_index + 1)
+            if self.relative_shapekey:
+                self.animate_relative_shapekeys(main_obj.data.shape_keys)
+            else:
+                self.animate_eval_time(main_obj.data.shape_keys)
 
         # Configure timeline
         context.scene.frame_start = 0
         context.scene.frame_end = max(shapekey_count, 1)
 
-        self.report({'INFO'}, f"Imported {len(filepaths)} frames as ShapeKeys")
+        if skipped:
+            self.report({'WARNING'}, f"Skipped {skipped} frames that could not be read or have a different vertex count")
+        else:
+            self.report({'INFO'}, f"Imported {shapekey_count + 1} frames as ShapeKeys")
+        return {"FINISHED"}
+
+    def import_base_object(self, filepath, collection=None, context=None):
+        """Import the first frame as the object that holds the whole sequence"""
+        main_obj = import_mesh_file(filepath)
+        if not main_obj:
+            return None
+
+        main_obj.location = (0, 0, 0)
+        main_obj.rotation_euler = (0, 0, 0)  
+
+        # Move to collection if it exists
+        if collection:
+            self.move_to_collection(main_obj, collection, context)
+            main_obj.name = f"{self.collection_name}_Base"
+
+        return main_obj
+
+    def import_as_stream(self, filepaths, collection=None, context=None):
+        """Write all frames to a frame cache that is streamed during playback"""
+        if not filepaths:
+            self.report({'ERROR'}, "No files selected")
+            return {"CANCELLED"}
+
+        main_obj = self.import_base_object(filepaths[0], collection, context)
+        if not main_obj or main_obj.type != 'MESH':
+            self.report({'ERROR'}, f"Failed to import {filepaths[0]}")
+            return {"CANCELLED"}
+
+        mesh = main_obj.data
+        cache_path = filepaths[0]
+        frame_count = len(filepaths)
+        skipped = 0
+
+        # Convert the sequence once; a cache that was picked directly is reused
+        if not is_cache_file(cache_path):
+            cache_path = get_cache_path(filepaths[0])
+            polygon_sizes, corner_verts, corner_uvs = get_topology(mesh)
+            try:
+                with FrameCacheWriter(cache_path, len(mesh.vertices), polygon_sizes, corner_verts, corner_uvs) as writer:
+                    coords = get_vertex_positions(mesh)
+                    writer.write_frame(coords, extract_number(filepaths[0]))
+                    for filepath, frame_coords, _colors in self.iter_frames(filepaths, mesh):
+                        # Hold the previous frame so cache indices keep matching the files
+                        if frame_coords is None:
+                            skipped += 1
+                        else:
+                            coords = frame_coords
+                        writer.write_frame(coords, extract_number(filepath))
+            except OSError as e:
+                self.report({'ERROR'}, f"Failed to write frame cache {cache_path}: {e}")
+                return {"CANCELLED"}
+        else:
+            frame_count = FrameCacheReader(str(cache_path)).frame_count
+
+        main_obj[CACHE_PATH_PROP] = bpy.path.relpath(str(cache_path))
+        main_obj[FRAME_START_PROP] = 0
+
+        # Configure timeline
+        context.scene.frame_start = 0
+        context.scene.frame_end = max(frame_count - 1, 1)
+        apply_cached_frame(main_obj, context.scene.frame_current)
+
+        if skipped:
+            self.report({'WARNING'}, f"Held {skipped} frames that could not be read or have a different vertex count")
+        else:
+            self.report({'INFO'}, f"Streamed {frame_count} frames from {cache_path.name}")
+        return {"FINISHED"}
+
+    def import_point_cache(self, filepath, cache_path, collection=None, context=None):
+        """Animate a base mesh with a PC2/MDD file"""
+        try:
+            reader = PointCacheReader(str(cache_path))
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Failed to read {cache_path.name}: {e}")
+            return {"CANCELLED"}
+
+        main_obj = self.import_base_object(filepath, collection, context)
+        if not main_obj or main_obj.type != 'MESH':
+            self.report({'ERROR'}, f"Failed to import {filepath}")
+            return {"CANCELLED"}
+
+        mesh = main_obj.data
+        if reader.point_count != len(mesh.vertices):
+            self.report({'ERROR'}, f"{cache_path.name} has {reader.point_count} points, "
+                                   f"{filepath.name} has {len(mesh.vertices)} vertices")
+            # Do not leave the unusable base mesh in the scene
+            bpy.data.objects.remove(main_obj)
+            if mesh.users == 0:
+                bpy.data.meshes.remove(mesh)
+            return {"CANCELLED"}
+
+        scene = context.scene
+        frame_start, frame_step = reader.frame_range(scene.render.fps / scene.render.fps_base)
+
+        if self.point_cache_setup == 'MODIFIER':
+            modifier = main_obj.modifiers.new("MeshCache", 'MESH_CACHE')
+            modifier.cache_format = reader.cache_format
+            modifier.filepath = bpy.path.relpath(str(cache_path))
+            modifier.frame_start = frame_start
+            modifier.frame_scale = 1.0 / frame_step
+            scene.frame_start = frame_start
+            scene.frame_end = frame_start + max(round((reader.frame_count - 1) * frame_step), 1)
+            self.report({'INFO'}, f"Added a Mesh Cache modifier reading {reader.frame_count} frames")
+            return {"FINISHED"}
+
+        # Same layout as a file sequence: every cached frame after the Basis
+        if not mesh.shape_keys:
+            main_obj.shape_key_add(name="Basis")
+        for index in range(reader.frame_count):
+            add_shapekey_from_positions(main_obj, f"Frame_{index + 1:04d}", reader.frame(index))
+        mesh.update()
+
+        if self.relative_shapekey:
+            self.animate_relative_shapekeys(mesh.shape_keys)
+        else:
+            self.animate_eval_time(mesh.shape_keys)
+
+        scene.frame_start = 0
+        scene.frame_end = max(reader.frame_count - 1, 1)
+
+        self.report({'INFO'}, f"Imported {reader.frame_count} frames from {cache_path.name} as ShapeKeys")
         return {"FINISHED"}
 
+    def iter_frames(self, filepaths, mesh, native=None, with_colors=False):
+        """Yield (filepath, positions, colors) for every frame after the first
+
+        Frames come from the frame cache when one was picked. Otherwise OBJ,
+        PLY and STL frames only have their vertices read, once frame 0
+        confirms the importer kept the file's vertex order.
+        """
+        if is_cache_file(filepaths[0]):
+            reader = FrameCacheReader(str(filepaths[0]))
+            for index in range(1, reader.frame_count):
+                yield filepaths[0], reader.frame(index), None
+            return
+
+        if native is None:
+            native = native_reader_matches(filepaths[0], mesh)
+        worker_count = self.worker_count if self.use_parallel else 1
+        yield from iter_vertex_positions(
+            filepaths[1:], len(mesh.vertices), native, worker_count, with_colors)
+
+    def animate_relative_shapekeys(self, key):
+        """Give every frame key its own fcurve that peaks at its frame"""
+        action = ensure_action(key, f"{key.name}Action")
+        for i, key_block in enumerate(key.key_blocks):
+            if key_block.name == "Basis":
+                continue
+
+            anim_index = i - 1
+            key_block.value = 0.0
+            set_keyframes(
+                action,
+                key_block.path_from_id("value"),
+                (anim_index - 1, anim_index, anim_index + 1),
+                (0.0, 1.0, 0.0),
+            )
+
+    def animate_eval_time(self, key):
+        """Drive absolute shapekeys with a single Evaluation Time fcurve
+
+        Only the two keys around the current evaluation time contribute, so
+        playback cost no longer grows with the number of frames.
+        """
+        key.use_relative = False
+        for key_block in key.key_blocks:
+            key_block.interpolation = 'KEY_LINEAR'
+
+        # Same timing as relative keys: frame N shows key N + 1
+        key_blocks = key.key_blocks[1:]
+        frames = range(len(key_blocks))
+        values = [key_block.frame for key_block in key_blocks]
+
+        action = ensure_action(key, f"{key.name}Action")
+        set_keyframes(action, "eval_time", frames, values, interpolation=self.eval_time_interpolation)
+
     def import_as_separate_objects(self, filepaths, collection=None, context=None):
         """Import each frame as separate object with visibility animation"""
         if not filepaths:
@@ -205,8 +446,7 @@ class ANIM_SEQ_OT_import_sequence(bpy.types.Operator, ImportHelper):
             return {"CANCELLED"}
 
         objects = []
-        for i, filepath in enumerate(filepaths):
-            obj = import_mesh_file(filepath)
+        for i, (filepath, obj) in enumerate(self.iter_frame_objects(filepaths, collection, context)):
             if obj:
                 obj.location = (0, 0, 0)
                 obj.rotation_euler = (0, 0, 0) 
@@ -218,23 +458,19 @@ class ANIM_SEQ_OT_import_sequence(bpy.types.Operator, ImportHelper):
                 
                 objects.append(obj)
                 
-                # Animate visibility
-                obj.hide_viewport = True
-                obj.hide_render = True
-                obj.keyframe_insert("hide_viewport", frame=0)
-                obj.keyframe_insert("hide_render", frame=0)
-                
-                # Show in current frame
-                obj.hide_viewport = False
-                obj.hide_render = False
-                obj.keyframe_insert("hide_viewport", frame=i)
-                obj.keyframe_insert("hide_render", frame=i)
-                
-                # Hide in next frame
+                # Animate visibility: hidden at frame 0, shown only at its own frame
+                keys = {0: 1.0}
+                keys[i] = 0.0
+                keys[i + 1] = 1.0
+                frames = sorted(keys)
+                values = [keys[frame] for frame in frames]
+
+                action = ensure_action(obj, f"{obj.name}Action")
+                for data_path in ("hide_viewport", "hide_render"):
+                    set_keyframes(action, data_path, frames, values, interpolation='CONSTANT')
+
                 obj.hide_viewport = True
                 obj.hide_render = True
-                obj.keyframe_insert("hide_viewport", frame=i+1)
-                obj.keyframe_insert("hide_render", frame=i+1)
 
         # Configure timeline
         context.scene.frame_start = 0
@@ -243,6 +479,46 @@ class ANIM_SEQ_OT_import_sequence(bpy.types.Operator, ImportHelper):
         self.report({'INFO'}, f"Imported {len(objects)} frames as separate objects")
         return {"FINISHED"}
 
+    def iter_frame_objects(self, filepaths, collection=None, context=None):
+        """Yield (filepath, object) for each frame of a separate objects import
+
+        In parallel mode, frames parsed by the workers become copies of the
+        first frame's mesh with their own positions and vertex colors; any
+        other frame goes through the regular importer.
+        """
+        first_obj = import_mesh_file(filepaths[0])
+        yield filepaths[0], first_obj
+
+        if not first_obj or first_obj.type != 'MESH':
+            native = False
+        elif is_cache_file(filepaths[0]):
+            native = True
+        else:
+            native = self.use_parallel and native_reader_matches(filepaths[0], first_obj.data)
+
+        if not native:
+            for filepath in filepaths[1:]:
+                yield filepath, import_mesh_file(filepath)
+            return
+
+        base_mesh = first_obj.data
+        frames = self.iter_frames(filepaths, base_mesh, native=True, with_colors=True)
+
+        for filepath, coords, colors in frames:
+            if coords is None:
+                yield filepath, import_mesh_file(filepath)
+                continue
+
+            mesh = base_mesh.copy()
+            mesh.vertices.foreach_set("co", coords)
+            if colors is not None:
+                set_vertex_colors(mesh, colors)
+            mesh.update()
+
+            obj = bpy.data.objects.new(filepath.stem, mesh)
+            (collection or context.collection).objects.link(obj)
+            yield filepath, obj
+
     def move_to_collection(self, obj, collection, context):
         """Move an object to a specific collection"""
         # Remove from all current collections
@@ -1,11 +1,50 @@
+from . import anim_utils
+from . import export_manifest
 from . import mesh_utils
+from . import shapekey_eval
+from . import armature_skinning
+from . import obj_reader
+from . import obj_writer
+from . import binary_mesh
+from . import export_pipeline
+from . import shard_runner
+from . import parallel_reader
+from . import frame_cache
+from . import point_cache
+from . import usd_writer
+from . import gltf_writer
+from . import frame_lru
+from . import frame_prefetch
+from . import stream_playback
 
 modules = (
+    anim_utils,
+    export_manifest,
     mesh_utils,
+    shapekey_eval,
+    armature_skinning,
+    obj_reader,
+    obj_writer,
+    binary_mesh,
+    export_pipeline,
+    shard_runner,
+    parallel_reader,
+    frame_cache,
+    point_cache,
+    usd_writer,
+    gltf_writer,
+    frame_lru,
+    frame_prefetch,
+    stream_playback,
 )
 
 def register():
-    pass  # Utils usually don't need registration
+    # Utils usually don't need registration, except for app handlers
+    for module in modules:
+        if hasattr(module, "register"):
+            module.register()
 
 def unregister():
-    pass
\ No newline at end of file
+    for module in reversed(modules):
+        if hasattr(module, "unregister"):
+            module.unregister()
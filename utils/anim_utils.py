@@ -0,0 +1,38 @@
+import bpy
+import numpy as np
+
+
+# Keyframe interpolation enum values as foreach_set expects them
+INTERPOLATION_VALUES = {
+    'CONSTANT': 0,
+    'LINEAR': 1,
+    'BEZIER': 2,
+}
+
+
+def ensure_action(id_data, name):
+    """Return the action animating id_data, creating it if needed"""
+    anim_data = id_data.animation_data or id_data.animation_data_create()
+    if anim_data.action is None:
+        anim_data.action = bpy.data.actions.new(name)
+    return anim_data.action
+
+
+def set_keyframes(action, data_path, frames, values, interpolation='LINEAR', index=0):
+    """Replace an fcurve's keyframes with frames/values in a few array writes"""
+    fcurve = action.fcurves.find(data_path, index=index)
+    if fcurve:
+        action.fcurves.remove(fcurve)
+    fcurve = action.fcurves.new(data_path, index=index)
+
+    count = len(frames)
+    co = np.empty(count * 2, dtype=np.float32)
+    co[0::2] = frames
+    co[1::2] = values
+
+    fcurve.keyframe_points.add(count)
+    fcurve.keyframe_points.foreach_set("co", co)
+    fcurve.keyframe_points.foreach_set(
+        "interpolation", np.full(count, INTERPOLATION_VALUES[interpolation], dtype=np.int32))
+    fcurve.update()
+    return fcurve
@@ -0,0 +1,110 @@
+"""Linear blend skinning of armature-only deformation in numpy
+
+The vertex group weights are gathered once into flat (vertex, bone, weight)
+arrays; every frame only needs the evaluated pose bone matrices.
+"""
+
+import numpy as np
+
+from .mesh_utils import get_vertex_positions
+
+
+def get_skinning_modifier(obj):
+    """Return the Armature modifier if it is obj's only deformation and plain LBS, else None"""
+    if obj.type != 'MESH' or obj.data.shape_keys:
+        return None
+
+    modifiers = [modifier for modifier in obj.modifiers if modifier.show_viewport]
+    if len(modifiers) != 1 or modifiers[0].type != 'ARMATURE':
+        return None
+
+    modifier = modifiers[0]
+    armature = modifier.object
+    if armature is None or armature.type != 'ARMATURE' or not armature.visible_get():
+        return None
+    if not modifier.use_vertex_groups or modifier.use_bone_envelopes:
+        return None
+    if modifier.use_deform_preserve_volume or modifier.use_multi_modifier or modifier.vertex_group:
+        return None
+    deform_bones = [bone for bone in armature.data.bones if bone.use_deform]
+    if not deform_bones or any(bone.bbone_segments > 1 for bone in deform_bones):
+        return None
+    return modifier
+
+
+class ArmatureSkinning:
+    """World-space positions of an armature-deformed mesh from its evaluated pose
+
+    Weights are normalized per vertex like the Armature modifier does, and
+    vertices without deform weights keep their rest position.
+    """
+
+    # The pose comes from the depsgraph, so the scene must still be evaluated
+    needs_scene = True
+
+    def __init__(self, obj, modifier):
+        self.obj = obj
+        self.modifier = modifier
+        self.armature = modifier.object
+
+        bones = [bone for bone in self.armature.data.bones if bone.use_deform]
+        self.bone_names = [bone.name for bone in bones]
+        self.rest_inverse = np.array([np.array(bone.matrix_local.inverted()) for bone in bones], dtype=np.float64).reshape(-1, 4, 4)
+
+        bone_indices = {name: index for index, name in enumerate(self.bone_names)}
+        group_bones = {group.index: bone_indices.get(group.name) for group in obj.vertex_groups}
+
+        vertex_indices = []
+        pair_bones = []
+        weights = []
+        for vertex in obj.data.vertices:
+            for element in vertex.groups:
+                bone_index = group_bones.get(element.group)
+                if bone_index is not None and element.weight > 0.0:
+                    vertex_indices.append(vertex.index)
+                    pair_bones.append(bone_index)
+                    weights.append(element.weight)
+
+        vertex_count = len(obj.data.vertices)
+        vertex_indices = np.array(vertex_indices, dtype=np.int64)
+        pair_bones = np.array(pair_bones, dtype=np.int64)
+        weights = np.array(weights, dtype=np.float64)
+
+        # Normalize by each vertex's total weight; nearly unweighted vertices stay in place
+        totals = np.bincount(vertex_indices, weights=weights, minlength=vertex_count)
+        weighted = totals > 0.0001
+        keep = weighted[vertex_indices]
+        vertex_indices, pair_bones = vertex_indices[keep], pair_bones[keep]
+        weights = weights[keep] / totals[vertex_indices]
+
+        # Unweighted vertices use an extra identity "bone" at index len(bones)
+        rest_vertices = np.flatnonzero(~weighted)
+        self.vertex_indices = np.concatenate([vertex_indices, rest_vertices])
+        self.pair_bones = np.concatenate([pair_bones, np.full(len(rest_vertices), len(bones))])
+        self.weights = np.concatenate([weights, np.ones(len(rest_vertices))])[:, None]
+
+        rest = get_vertex_positions(obj.data).reshape(-1, 3).astype(np.float64)
+        self.pair_rest = rest[self.vertex_indices]
+        self.vertex_count = vertex_count
+
+    def positions(self, frame, depsgraph):
+        """Flat float32 world-space positions for the pose evaluated in depsgraph"""
+        armature = self.armature.evaluated_get(depsgraph)
+        obj = self.obj.evaluated_get(depsgraph)
+        armature_world = np.array(armature.matrix_world, dtype=np.float64)
+        obj_world = np.array(obj.matrix_world, dtype=np.float64)
+
+        # Object space to armature space, through each bone, then to world space
+        pose = np.array([np.array(armature.pose.bones[name].matrix) for name in self.bone_names], dtype=np.float64)
+        to_armature = np.linalg.inv(armature_world) @ obj_world
+        matrices = armature_world @ pose @ self.rest_inverse @ to_armature
+        matrices = np.concatenate([matrices, obj_world[None]])
+
+        pair_matrices = matrices[self.pair_bones]
+        deformed = np.einsum('pij,pj->pi', pair_matrices[:, :3, :3], self.pair_rest) + pair_matrices[:, :3, 3]
+        deformed *= self.weights
+
+        positions = np.empty((self.vertex_count, 3), dtype=np.float32)
+        for axis in range(3):
+            positions[:, axis] = np.bincount(self.vertex_indices, weights=deformed[:, axis], minlength=self.vertex_count)
+        return positions.ravel()
@@ -0,0 +1,249 @@
+"""Binary PLY and STL readers and writers
+
+Both formats store fixed-stride records, so vertices and triangles are read
+with one numpy.frombuffer call and written with one tofile call. ASCII files
+raise ValueError and are left to Blender's importers.
+"""
+
+import struct
+
+import numpy as np
+
+
+BINARY_MESH_EXTENSIONS = {".ply", ".stl"}
+
+_PLY_TYPES = {
+    "char": "i1", "int8": "i1",
+    "uchar": "u1", "uint8": "u1",
+    "short": "i2", "int16": "i2",
+    "ushort": "u2", "uint16": "u2",
+    "int": "i4", "int32": "i4",
+    "uint": "u4", "uint32": "u4",
+    "float": "f4", "float32": "f4",
+    "double": "f8", "float64": "f8",
+}
+_PLY_BYTE_ORDERS = {"binary_little_endian": "<", "binary_big_endian": ">"}
+
+# 12 float32 (normal and three corners) plus a uint16 attribute count
+_STL_RECORD = np.dtype([
+    ("normal", "<f4", (3,)),
+    ("vertices", "<f4", (3, 3)),
+    ("attribute", "<u2"),
+])
+_STL_HEADER_SIZE = 80
+
+
+def _read_ply_header(f):
+    """Return (byte order, [(element, count, properties)]) of a binary PLY
+
+    Scalar properties are (name, type); list properties are
+    (name, (count type, item type)).
+    """
+    if f.readline().strip() != b"ply":
+        raise ValueError("Not a PLY file")
+
+    byte_order = None
+    elements = []
+    while True:
+        line = f.readline()
+        if not line:
+            raise ValueError("Truncated PLY header")
+        words = line.decode("ascii", "replace").split()
+        if not words or words[0] in ("comment", "obj_info"):
+            continue
+        if words[0] == "format":
+            if words[1] not in _PLY_BYTE_ORDERS:
+                raise ValueError(f"Unsupported PLY format {words[1]}")
+            byte_order = _PLY_BYTE_ORDERS[words[1]]
+        elif words[0] == "element":
+            elements.append((words[1], int(words[2]), []))
+        elif words[0] == "property":
+            if words[1] == "list":
+                elements[-1][2].append((words[4], (_PLY_TYPES[words[2]], _PLY_TYPES[words[3]])))
+            else:
+                elements[-1][2].append((words[2], _PLY_TYPES[words[1]]))
+        elif words[0] == "end_header":
+            break
+
+    if byte_order is None:
+        raise ValueError("PLY header has no format")
+    return byte_order, elements
+
+
+def _read_ply_lists(data, offset, count, byte_order, count_type, item_type):
+    """Read a single-list PLY element; return (sizes, items, end offset)"""
+    count_dtype = np.dtype(byte_order + count_type)
+    item_dtype = np.dtype(byte_order + item_type)
+    if count == 0:
+        return np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32), offset
+
+    # Meshes with a single polygon size are one fixed-stride block
+    size = int(np.frombuffer(data, count_dtype, 1, offset)[0])
+    record = np.dtype([("size", count_dtype), ("items", item_dtype, (size,))])
+    if offset + count * record.itemsize <= len(data):
+        block = np.frombuffer(data, record, count, offset)
+        if np.all(block["size"] == size):
+            sizes = np.full(count, size, dtype=np.int32)
+            return sizes, block["items"].astype(np.int32).ravel(), offset + count * record.itemsize
+
+    sizes = np.empty(count, dtype=np.int32)
+    items = []
+    for index in range(count):
+        size = int(np.frombuffer(data, count_dtype, 1, offset)[0])
+        offset += count_dtype.itemsize
+        items.append(np.frombuffer(data, item_dtype, size, offset))
+        offset += size * item_dtype.itemsize
+        sizes[index] = size
+    return sizes, np.concatenate(items).astype(np.int32), offset
+
+
+def read_ply(filepath):
+    """Read a binary PLY into (positions, polygon_sizes, corner_verts, colors)
+
+    positions and colors (sRGB, or None) are flat float32 arrays; the face
+    arrays are empty for point clouds.
+    """
+    with open(filepath, 'rb') as f:
+        byte_order, elements = _read_ply_header(f)
+        data = f.read()
+
+    offset = 0
+    vertices = None
+    polygon_sizes = np.zeros(0, dtype=np.int32)
+    corner_verts = np.zeros(0, dtype=np.int32)
+
+    for name, count, properties in elements:
+        lists = [prop for prop in properties if isinstance(prop[1], tuple)]
+        if not lists:
+            dtype = np.dtype([(prop, byte_order + prop_type) for prop, prop_type in properties])
+            if offset + count * dtype.itemsize > len(data):
+                raise ValueError(f"Truncated PLY element {name}")
+            block = np.frombuffer(data, dtype, count, offset)
+            offset += count * dtype.itemsize
+            if name == "vertex":
+                vertices = block
+        elif len(properties) == 1:
+            sizes, items, offset = _read_ply_lists(data, offset, count, byte_order, *properties[0][1])
+            if name == "face":
+                polygon_sizes, corner_verts = sizes, items
+        else:
+            raise ValueError(f"Unsupported PLY element {name}")
+
+    if vertices is None:
+        raise ValueError("PLY file has no vertices")
+
+    positions = np.empty((len(vertices), 3), dtype=np.float32)
+    for axis, prop in enumerate("xyz"):
+        positions[:, axis] = vertices[prop]
+
+    colors = None
+    if all(prop in vertices.dtype.names for prop in ("red", "green", "blue")):
+        colors = np.empty((len(vertices), 3), dtype=np.float32)
+        for channel, prop in enumerate(("red", "green", "blue")):
+            colors[:, channel] = vertices[prop]
+        if vertices.dtype["red"].kind in "iu":
+            colors /= 255.0
+        colors = colors.ravel()
+
+    return positions.ravel(), polygon_sizes, corner_verts, colors
+
+
+def write_ply(filepath, positions, polygon_sizes, corner_verts, colors=None):
+    """Write a binary little-endian PLY with optional sRGB vertex colors"""
+    points = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+    polygon_sizes = np.asarray(polygon_sizes, dtype=np.int32)
+
+    fields = [("x", "<f4"), ("y", "<f4"), ("z", "<f4")]
+    if colors is not None:
+        fields += [("red", "u1"), ("green", "u1"), ("blue", "u1")]
+    vertices = np.empty(len(points), dtype=fields)
+    vertices["x"], vertices["y"], vertices["z"] = points.T
+    if colors is not None:
+        rgb = np.clip(np.rint(np.asarray(colors, dtype=np.float32).reshape(-1, 3) * 255.0), 0, 255)
+        vertices["red"], vertices["green"], vertices["blue"] = rgb.astype(np.uint8).T
+
+    # Each face record is its corner count followed by its int32 corners
+    count_type = "uchar" if len(polygon_sizes) == 0 or polygon_sizes.max() < 256 else "int"
+    count_dtype = np.dtype("u1" if count_type == "uchar" else "<i4")
+    record_sizes = count_dtype.itemsize + 4 * polygon_sizes
+    record_starts = np.zeros(len(polygon_sizes), dtype=np.int64)
+    np.cumsum(record_sizes[:-1], out=record_starts[1:])
+    loop_starts = np.zeros(len(polygon_sizes), dtype=np.int64)
+    np.cumsum(polygon_sizes[:-1], out=loop_starts[1:])
+
+    faces = np.empty(int(record_sizes.sum()), dtype=np.uint8)
+    count_bytes = polygon_sizes.astype(count_dtype).view(np.uint8).reshape(-1, count_dtype.itemsize)
+    faces[record_starts[:, None] + np.arange(count_dtype.itemsize)] = count_bytes
+
+    corner_faces = np.repeat(np.arange(len(polygon_sizes)), polygon_sizes)
+    corner_local = np.arange(len(corner_faces)) - loop_starts[corner_faces]
+    corner_starts = record_starts[corner_faces] + count_dtype.itemsize + 4 * corner_local
+    corner_bytes = np.asarray(corner_verts, dtype="<i4").view(np.uint8).reshape(-1, 4)
+    faces[corner_starts[:, None] + np.arange(4)] = corner_bytes
+
+    header = ["ply", "format binary_little_endian 1.0", "comment Written by anim-seq",
+              f"element vertex {len(points)}"]
+    header += [f"property {'float' if prop_type == '<f4' else 'uchar'} {prop}" for prop, prop_type in fields]
+    header += [f"element face {len(polygon_sizes)}",
+               f"property list {count_type} int vertex_indices", "end_header"]
+
+    with open(filepath, 'wb') as f:
+        f.write(("\n".join(header) + "\n").encode("ascii"))
+        vertices.tofile(f)
+        faces.tofile(f)
+
+
+def read_stl(filepath):
+    """Read a binary STL into (positions, polygon_sizes, corner_verts)
+
+    Corners at the same position share one vertex, numbered in order of
+    first occurrence so every frame of a sequence gets the same order.
+    """
+    with open(filepath, 'rb') as f:
+        header = f.read(_STL_HEADER_SIZE + 4)
+        data = f.read()
+
+    if len(header) < _STL_HEADER_SIZE + 4:
+        raise ValueError("Not a binary STL file")
+    (count,) = struct.unpack("<I", header[_STL_HEADER_SIZE:])
+    if len(data) != count * _STL_RECORD.itemsize:
+        raise ValueError("Not a binary STL file")
+
+    records = np.frombuffer(data, _STL_RECORD, count)
+    # Adding zero folds -0.0 into 0.0 so both weld
+    corners = records["vertices"].reshape(-1, 3) + np.float32(0.0)
+
+    unique, first, inverse = np.unique(corners, axis=0, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind="stable")
+    rank = np.empty_like(order)
+    rank[order] = np.arange(len(order))
+
+    positions = np.ascontiguousarray(unique[order], dtype=np.float32).ravel()
+    corner_verts = rank[inverse.ravel()].astype(np.int32)
+    return positions, np.full(count, 3, dtype=np.int32), corner_verts
+
+
+def write_stl(filepath, positions, triangles):
+    """Write triangles (flat vertex indices) as a binary STL with face normals"""
+    points = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+    corners = points[np.asarray(triangles, dtype=np.int64).reshape(-1, 3)]
+
+    records = np.zeros(len(corners), dtype=_STL_RECORD)
+    records["vertices"] = corners
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, lengths, out=normals, where=lengths > 0)
+    records["normal"] = normals
+
+    with open(filepath, 'wb') as f:
+        f.write(b"Binary STL written by anim-seq".ljust(_STL_HEADER_SIZE, b" "))
+        f.write(struct.pack("<I", len(records)))
+        records.tofile(f)
+
+
+def read_binary_vertices(filepath):
+    """Read the vertex positions (and PLY colors) of a binary PLY or STL frame"""
+    if str(filepath).lower().endswith(".stl"):
+        return read_stl(filepath)[0], None
+    positions, _sizes, _corners, colors = read_ply(filepath)
+    return positions, colors
@@ -0,0 +1,154 @@
+"""Atomic frame writes and a resumable progress journal"""
+
+import glob
+import json
+import os
+import shutil
+import threading
+
+
+JOURNAL_SUFFIX = "_journal"
+JOURNAL_EXTENSION = ".jsonl"
+PARTIAL_TAG = ".partial"
+
+
+def partial_path(filename):
+    """Temporary name a file is written under before it is renamed into place"""
+    root, ext = os.path.splitext(filename)
+    return root + PARTIAL_TAG + ext
+
+
+def write_atomic(filename, write, *args):
+    """Call write(temp_path, *args), then move the result over filename
+
+    A crash or error never leaves a truncated file under the final name.
+    """
+    temp_path = partial_path(filename)
+    try:
+        write(temp_path, *args)
+        os.replace(temp_path, filename)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def rename_partial_mtl(temp_path):
+    """Move the .mtl written next to a partial OBJ to its final name
+
+    Exporters name the material library after the OBJ they were given, so
+    the OBJ's mtllib line is pointed at the final name as well.
+    """
+    temp_root = os.path.splitext(temp_path)[0]
+    temp_mtl = temp_root + ".mtl"
+    if not temp_root.endswith(PARTIAL_TAG) or not os.path.exists(temp_mtl):
+        return
+
+    final_mtl = temp_root[:-len(PARTIAL_TAG)] + ".mtl"
+    with open(temp_path, 'rb') as f:
+        data = f.read()
+    old_line = b"mtllib " + os.path.basename(temp_mtl).encode("utf-8")
+    new_line = b"mtllib " + os.path.basename(final_mtl).encode("utf-8")
+    with open(temp_path, 'wb') as f:
+        f.write(data.replace(old_line, new_line, 1))
+    os.replace(temp_mtl, final_mtl)
+
+
+def link_atomic(filename, source):
+    """Make filename a hard link to source, or a copy where links are unsupported
+
+    Like write_atomic, the link only appears under filename once it is complete.
+    """
+    # Renaming a link over another link to the same file is a no-op
+    if os.path.exists(filename) and os.path.samefile(filename, source):
+        return
+
+    temp_path = partial_path(filename)
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+    try:
+        os.link(source, temp_path)
+    except OSError:
+        shutil.copyfile(source, temp_path)
+    os.replace(temp_path, filename)
+
+
+def remove_partial_files(folder_path, base_name):
+    """Delete partial files left behind by an interrupted export"""
+    pattern = os.path.join(glob.escape(folder_path), glob.escape(base_name) + "*" + PARTIAL_TAG + ".*")
+    for path in glob.glob(pattern):
+        try:
+            os.remove(path)
+        except OSError as e:
+            print(f"Error removing {path}: {e}")
+
+
+class ExportJournal:
+    """Append-only log of the frames an export has finished, one JSON line each
+
+    Lines are flushed as they are written, so the journal survives a crash
+    and a resumed export knows which (object, frame) pairs are done.
+    """
+
+    def __init__(self, folder_path, base_name, label="", settings_hash=None):
+        self.folder_path = folder_path
+        self.base_name = base_name
+        self.settings_hash = settings_hash
+        name = base_name + JOURNAL_SUFFIX + (f".{label}" if label else "") + JOURNAL_EXTENSION
+        self.filepath = os.path.join(folder_path, name)
+        self._lock = threading.Lock()
+        self._file = None
+
+    def journal_paths(self):
+        """This export's journal and those of its shards"""
+        pattern = glob.escape(self.base_name) + JOURNAL_SUFFIX + "*" + JOURNAL_EXTENSION
+        return glob.glob(os.path.join(glob.escape(self.folder_path), pattern))
+
+    def load_completed(self):
+        """Return the set of (object name, frame) pairs whose file still exists
+
+        Entries written with other output settings are ignored, so their
+        frames are exported again.
+        """
+        completed = set()
+        for path in self.journal_paths():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    lines = f.readlines()
+            except OSError:
+                continue
+            for line in lines:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Last line of a crashed run may be cut off
+                if entry.get("settings") != self.settings_hash:
+                    continue
+                if os.path.exists(os.path.join(self.folder_path, entry["file"])):
+                    completed.add((entry["object"], entry["frame"]))
+        return completed
+
+    def open(self, append):
+        self._file = open(self.filepath, 'a' if append else 'w', encoding='utf-8')
+
+    def record(self, object_name, frame, filename):
+        line = json.dumps({
+            "object": object_name,
+            "frame": frame,
+            "file": os.path.basename(filename),
+            "settings": self.settings_hash,
+        })
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def remove_all(self):
+        """Delete the journals once the export has fully completed"""
+        self.close()
+        for path in self.journal_paths():
+            os.remove(path)
@@ -0,0 +1,120 @@
+"""Per-frame content hashes of an export"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+
+MANIFEST_SUFFIX = "_manifest.json"
+MANIFEST_VERSION = 1
+
+
+def hash_settings(settings):
+    """Hash the export settings that change the written files"""
+    text = json.dumps(settings, sort_keys=True, default=str)
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def hash_buffers(*buffers):
+    """Hash a sequence of arrays (or strings, or None) into one hex digest"""
+    digest = hashlib.blake2b(digest_size=16)
+    for buffer in buffers:
+        if buffer is None:
+            digest.update(b"\0none")
+        elif isinstance(buffer, str):
+            digest.update(buffer.encode('utf-8'))
+        else:
+            array = np.ascontiguousarray(buffer)
+            digest.update(f"\0{array.dtype.str}{array.shape}".encode('ascii'))
+            digest.update(array.data)
+    return digest.hexdigest()
+
+
+class ExportManifest:
+    """Map exported file names to the content hash they were written from
+
+    Entries are only trusted when the settings hash of the previous run
+    matches. Records can be saved to a different file than the one loaded
+    (used by export shards, whose manifests are merged afterwards). Frames
+    that were not written because an earlier file holds the same content
+    are listed under "references" with the name of that file.
+    """
+
+    def __init__(self, filepath, settings_hash, save_path=None):
+        self.filepath = filepath
+        self.save_path = save_path or filepath
+        self.settings_hash = settings_hash
+        self.frames = {}
+        self.records = {}
+        self.references = {}
+        self.reference_records = {}
+
+        data = self.load(filepath)
+        if data and data.get("settings") == settings_hash:
+            self.frames = data.get("frames", {})
+            self.references = data.get("references", {})
+
+    @staticmethod
+    def load(filepath):
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data if data.get("version") == MANIFEST_VERSION else None
+
+    def source_of(self, filename):
+        """Path of the file that holds the content of filename"""
+        name = os.path.basename(filename)
+        return os.path.join(os.path.dirname(filename), self.references.get(name, name))
+
+    def is_current(self, filename, content_hash):
+        """Check whether filename was already written from this exact content"""
+        name = os.path.basename(filename)
+        source = self.source_of(filename)
+        return (
+            self.frames.get(name) == content_hash
+            and self.frames.get(os.path.basename(source)) == content_hash
+            and os.path.exists(source)
+        )
+
+    def record(self, filename, content_hash):
+        name = os.path.basename(filename)
+        self.frames[name] = content_hash
+        self.records[name] = content_hash
+        self.references.pop(name, None)
+        self.reference_records.pop(name, None)
+
+    def record_reference(self, filename, source_filename, content_hash):
+        """Record that filename was not written because source_filename holds its content"""
+        name = os.path.basename(filename)
+        source = os.path.basename(self.source_of(source_filename))
+        self.frames[name] = content_hash
+        self.records[name] = content_hash
+        self.references[name] = source
+        self.reference_records[name] = source
+
+    def save(self, only_records=False):
+        """Write the manifest atomically"""
+        data = {
+            "version": MANIFEST_VERSION,
+            "settings": self.settings_hash,
+            "frames": dict(sorted((self.records if only_records else self.frames).items())),
+            "references": dict(sorted((self.reference_records if only_records else self.references).items())),
+        }
+        temp_path = self.save_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=1)
+        os.replace(temp_path, self.save_path)
+
+    def merge(self, filepaths):
+        """Fold the records of other manifests (e.g. finished shards) into this one"""
+        for filepath in filepaths:
+            data = self.load(filepath)
+            if data and data.get("settings") == self.settings_hash:
+                self.frames.update(data.get("frames", {}))
+                for name in data.get("frames", {}):
+                    self.references.pop(name, None)
+                self.references.update(data.get("references", {}))
@@ -0,0 +1,58 @@
+"""Bounded producer/consumer queue for export writes"""
+
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+
+class WritePipeline:
+    """Run serialization and file writes on worker threads
+
+    The main thread keeps sampling frames while earlier frames are written.
+    At most queue_depth jobs are pending at once; submit blocks when the
+    queue is full so memory stays bounded. With worker_count 0 every job
+    runs inline.
+    """
+
+    def __init__(self, worker_count=0, queue_depth=8):
+        self.completed = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max(queue_depth, 1))
+        self._executor = ThreadPoolExecutor(worker_count, thread_name_prefix="anim_seq_export") if worker_count > 0 else None
+
+    def submit(self, label, func, *args, on_success=None):
+        """Queue func(*args); on_success() runs on the worker once it succeeded"""
+        if self._executor is None:
+            self._run(label, func, args, on_success)
+            return
+
+        self._slots.acquire()
+        future = self._executor.submit(self._run, label, func, args, on_success)
+        future.add_done_callback(lambda _future: self._slots.release())
+
+    def _run(self, label, func, args, on_success):
+        try:
+            func(*args)
+            if on_success:
+                on_success()
+        except Exception as e:
+            print(f"Error exporting {label}: {str(e)}")
+            traceback.print_exc()
+            with self._lock:
+                self.failed += 1
+        else:
+            with self._lock:
+                self.completed += 1
+
+    def close(self):
+        """Wait for every queued job to finish"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,141 @@
+"""On-disk frame cache for mesh sequences
+
+Layout, all little-endian and 4-byte aligned::
+
+    header    magic, version, counts and section offsets
+    topology  polygon sizes (uint32), corner vertex indices (uint32),
+              optional corner UVs (float32 pairs)
+    frames    frame_count blocks of vertex_count * 3 float32 positions
+    index     source frame number of each block (int32)
+
+Every frame block has the same size, so any frame is one seek away.
+"""
+
+import struct
+
+import numpy as np
+
+
+CACHE_EXTENSION = ".animseq"
+CACHE_MAGIC = b"ASEQ"
+CACHE_VERSION = 2
+
+# magic, version, vertex count, frame count, polygon count, corner count,
+# has uvs, frames offset, index offset
+_HEADER = struct.Struct("<4sIIIIII4xQQ")
+
+
+def is_cache_file(filepath):
+    """Check whether a path points to a frame cache"""
+    return str(filepath).lower().endswith(CACHE_EXTENSION)
+
+
+class FrameCacheWriter:
+    """Write the topology once, then append fixed-size float32 position frames"""
+
+    def __init__(self, filepath, vertex_count, polygon_sizes=None, corner_verts=None, corner_uvs=None):
+        self.filepath = filepath
+        self.vertex_count = vertex_count
+        self.frame_numbers = []
+
+        polygon_sizes = np.asarray(polygon_sizes if polygon_sizes is not None else (), dtype=np.uint32)
+        corner_verts = np.asarray(corner_verts if corner_verts is not None else (), dtype=np.uint32)
+        self.polygon_count = polygon_sizes.size
+        self.corner_count = corner_verts.size
+        self.has_uvs = corner_uvs is not None
+
+        self._file = open(filepath, 'wb')
+        self._file.write(self._header(0, 0))
+        self._file.write(polygon_sizes.tobytes())
+        self._file.write(corner_verts.tobytes())
+        if self.has_uvs:
+            self._file.write(np.asarray(corner_uvs, dtype=np.float32).tobytes())
+        self.frames_offset = self._file.tell()
+
+    def _header(self, frames_offset, index_offset):
+        return _HEADER.pack(
+            CACHE_MAGIC, CACHE_VERSION, self.vertex_count, len(self.frame_numbers),
+            self.polygon_count, self.corner_count, int(self.has_uvs),
+            frames_offset, index_offset,
+        )
+
+    def write_frame(self, positions, frame_number=None):
+        positions = np.asarray(positions, dtype=np.float32)
+        if positions.size != self.vertex_count * 3:
+            raise ValueError(f"Expected {self.vertex_count} vertices, got {positions.size // 3}")
+        self._file.write(positions.tobytes())
+        self.frame_numbers.append(len(self.frame_numbers) if frame_number is None else frame_number)
+
+    def close(self):
+        if self._file.closed:
+            return
+        # The index and frame count are only known once every frame is written
+        index_offset = self._file.tell()
+        self._file.write(np.asarray(self.frame_numbers, dtype=np.int32).tobytes())
+        self._file.seek(0)
+        self._file.write(self._header(self.frames_offset, index_offset))
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class FrameCacheReader:
+    """Memory-map a cache file and hand out frames without loading the whole cache"""
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        with open(filepath, 'rb') as f:
+            header = f.read(_HEADER.size)
+
+        if len(header) != _HEADER.size or header[:4] != CACHE_MAGIC:
+            raise ValueError(f"{filepath} is not an anim-seq frame cache")
+
+        (_magic, version, self.vertex_count, self.frame_count, self.polygon_count,
+         self.corner_count, has_uvs, frames_offset, index_offset) = _HEADER.unpack(header)
+        if version != CACHE_VERSION:
+            raise ValueError(f"Unsupported frame cache version {version} in {filepath}")
+        if self.frame_count == 0:
+            raise ValueError(f"{filepath} contains no frames")
+
+        self.has_uvs = bool(has_uvs)
+        self.frames_offset = frames_offset
+        self._data = np.memmap(filepath, dtype=np.uint8, mode='r')
+
+        offset = _HEADER.size
+        self.polygon_sizes = self._data[offset:offset + self.polygon_count * 4].view(np.uint32)
+        offset += self.polygon_count * 4
+        self.corner_verts = self._data[offset:offset + self.corner_count * 4].view(np.uint32)
+        offset += self.corner_count * 4
+        self.corner_uvs = None
+        if self.has_uvs:
+            self.corner_uvs = self._data[offset:offset + self.corner_count * 8].view(np.float32)
+
+        stride = self.vertex_count * 3
+        self._frames = self._data[frames_offset:frames_offset + self.frame_count * stride * 4]
+        self._frames = self._frames.view(np.float32).reshape(self.frame_count, stride)
+        self.frame_numbers = self._data[index_offset:index_offset + self.frame_count * 4].view(np.int32)
+
+    @property
+    def has_topology(self):
+        return self.polygon_count > 0
+
+    def frame(self, index):
+        """Return the flat positions of a frame, clamped to the cached range"""
+        index = min(max(index, 0), self.frame_count - 1)
+        return self._frames[index]
+
+    def read_frame(self, index, file):
+        """Read a frame with a plain file read instead of touching the memory map
+
+        Meant for background threads: the read releases the GIL while it
+        waits on the disk, and file must be a handle owned by the caller.
+        """
+        index = min(max(index, 0), self.frame_count - 1)
+        positions = np.empty(self.vertex_count * 3, dtype=np.float32)
+        file.seek(self.frames_offset + index * positions.nbytes)
+        file.readinto(memoryview(positions).cast('B'))
+        return positions
@@ -0,0 +1,71 @@
+"""Size-bounded LRU cache of decoded frames"""
+
+import threading
+from collections import OrderedDict
+
+
+class FrameLRU:
+    """Keep recently used frame arrays in memory up to a byte budget"""
+
+    def __init__(self, budget_bytes=0):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._frames = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._frames
+
+    def get(self, key):
+        """Return a cached frame and mark it as recently used, or None"""
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is None:
+                self.misses += 1
+                return None
+            self._frames.move_to_end(key)
+            self.hits += 1
+            return frame
+
+    def put(self, key, frame):
+        """Store a frame, evicting the least recently used ones past the budget"""
+        with self._lock:
+            if frame.nbytes > self.budget_bytes:
+                return
+            old = self._frames.pop(key, None)
+            if old is not None:
+                self.used_bytes -= old.nbytes
+            self._frames[key] = frame
+            self.used_bytes += frame.nbytes
+            self._evict()
+
+    def set_budget(self, budget_bytes):
+        with self._lock:
+            self.budget_bytes = budget_bytes
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+            self.used_bytes = 0
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def _evict(self):
+        while self.used_bytes > self.budget_bytes and self._frames:
+            _key, frame = self._frames.popitem(last=False)
+            self.used_bytes -= frame.nbytes
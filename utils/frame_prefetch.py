@@ -0,0 +1,144 @@
+"""Background read-ahead of streamed frames"""
+
+import math
+import threading
+import time
+
+
+class _Target:
+    """Playhead state of one streamed object"""
+
+    def __init__(self, reader, index):
+        self.reader = reader
+        self.index = index
+        self.step = 1
+        self.speed = 0.0
+        self.time = time.perf_counter()
+
+
+class FramePrefetcher:
+    """Decode frames ahead of the playhead into a FrameLRU from a worker thread
+
+    The lookahead follows the playback direction and grows with playback
+    speed times the measured read latency, so slow disks get a deeper
+    buffer while fast ones do not waste the cache budget.
+    """
+
+    def __init__(self, frame_lru, min_ahead=2, max_ahead=64):
+        self.frame_lru = frame_lru
+        self.min_ahead = min_ahead
+        self.max_ahead = max_ahead
+        self.read_latency = 0.0
+        self._targets = {}
+        self._files = {}
+        self._generation = 0
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="anim_seq_prefetch", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+        self._close_files()
+
+    def clear(self):
+        with self._condition:
+            self._targets.clear()
+            self._generation += 1
+
+    def update(self, name, reader, index):
+        """Report the playhead of a streamed object (main thread)"""
+        now = time.perf_counter()
+        with self._condition:
+            target = self._targets.get(name)
+            if target is None or target.reader is not reader:
+                target = self._targets[name] = _Target(reader, index)
+            else:
+                delta = index - target.index
+                elapsed = now - target.time
+                if delta:
+                    target.step = delta
+                    if elapsed > 0:
+                        speed = abs(delta) / elapsed
+                        target.speed = speed if target.speed == 0.0 else 0.7 * target.speed + 0.3 * speed
+                target.index = index
+                target.time = now
+
+            self._generation += 1
+            self._condition.notify()
+
+    def lookahead(self, target):
+        """Number of frames to keep decoded ahead of a target's playhead"""
+        needed = target.speed * self.read_latency * 2.0 / max(abs(target.step), 1)
+        return max(self.min_ahead, min(self.max_ahead, self.min_ahead + math.ceil(needed)))
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._running and not self._targets:
+                    self._condition.wait()
+                if not self._running:
+                    return
+                generation = self._generation
+                targets = [(name, target.reader, target.index, target.step, self.lookahead(target))
+                           for name, target in self._targets.items()]
+
+            # File handles belong to this thread; drop those of readers no longer played
+            readers = {target[1] for target in targets}
+            for reader in [reader for reader in self._files if reader not in readers]:
+                self._files.pop(reader).close()
+
+            for name, reader, index, step, ahead in targets:
+                if not self._prefetch(name, reader, index, step, ahead, generation):
+                    break
+
+            with self._condition:
+                # Sleep until the playhead moves again
+                while self._running and self._generation == generation:
+                    self._condition.wait()
+                if not self._running:
+                    return
+
+    def _prefetch(self, name, reader, index, step, ahead, generation):
+        for offset in range(1, ahead + 1):
+            frame_index = index + step * offset
+            if frame_index < 0 or frame_index >= reader.frame_count:
+                break
+            if (name, frame_index) in self.frame_lru:
+                continue
+            if self._generation != generation:
+                return False
+
+            start = time.perf_counter()
+            try:
+                positions = reader.read_frame(frame_index, self._get_file(reader))
+            except (OSError, ValueError) as e:
+                print(f"Error prefetching frame {frame_index} of {reader.filepath}: {e}")
+                return True
+            latency = time.perf_counter() - start
+            self.read_latency = latency if self.read_latency == 0.0 else 0.8 * self.read_latency + 0.2 * latency
+
+            self.frame_lru.put((name, frame_index), positions)
+        return True
+
+    def _get_file(self, reader):
+        file = self._files.get(reader)
+        if file is None:
+            file = self._files[reader] = open(reader.filepath, 'rb')
+        return file
+
+    def _close_files(self):
+        for file in self._files.values():
+            file.close()
+        self._files.clear()
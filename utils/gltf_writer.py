@@ -0,0 +1,188 @@
+"""Binary glTF (GLB) with one morph target per frame
+
+Every mesh stores base positions once and each frame as a
+sparse POSITION target holding only the vertices that moved. A STEP weights
+animation switches one target on per frame.
+"""
+
+import json
+import struct
+
+import numpy as np
+
+
+GLB_MAGIC = b"glTF"
+_GLB_HEADER = struct.Struct("<4sII")
+_CHUNK_HEADER = struct.Struct("<I4s")
+
+# glTF component types and buffer view targets
+FLOAT = 5126
+UNSIGNED_INT = 5125
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+
+
+class GltfMorphWriter:
+    """Collect meshes and their frame targets, then write them as one GLB"""
+
+    def __init__(self):
+        self.gltf = {
+            "asset": {"version": "2.0", "generator": "anim-seq"},
+            "scene": 0,
+            "scenes": [{"nodes": []}],
+            "nodes": [],
+            "meshes": [],
+            "accessors": [],
+            "bufferViews": [],
+        }
+        self._chunks = []
+        self._length = 0
+        self._bases = []
+        self._times = []
+
+    def _add_view(self, data, target=None):
+        data = np.ascontiguousarray(data)
+        view = {"buffer": 0, "byteOffset": self._length, "byteLength": data.nbytes}
+        if target:
+            view["target"] = target
+        self._chunks.append(data.tobytes())
+        self._length += data.nbytes
+
+        # Every view starts 4-byte aligned
+        padding = -self._length % 4
+        if padding:
+            self._chunks.append(b"\0" * padding)
+            self._length += padding
+
+        self.gltf["bufferViews"].append(view)
+        return len(self.gltf["bufferViews"]) - 1
+
+    def _add_accessor(self, accessor):
+        self.gltf["accessors"].append(accessor)
+        return len(self.gltf["accessors"]) - 1
+
+    def add_mesh(self, name, positions, triangles):
+        """Add a node and mesh with base positions and triangle vertex indices; return its handle"""
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+        triangles = np.asarray(triangles, dtype=np.uint32)
+
+        position_accessor = self._add_accessor({
+            "bufferView": self._add_view(positions, ARRAY_BUFFER),
+            "componentType": FLOAT,
+            "count": len(positions),
+            "type": "VEC3",
+            "min": positions.min(axis=0).tolist(),
+            "max": positions.max(axis=0).tolist(),
+        })
+        index_accessor = self._add_accessor({
+            "bufferView": self._add_view(triangles, ELEMENT_ARRAY_BUFFER),
+            "componentType": UNSIGNED_INT,
+            "count": len(triangles),
+            "type": "SCALAR",
+        })
+
+        self.gltf["meshes"].append({
+            "name": name,
+            "primitives": [{
+                "attributes": {"POSITION": position_accessor},
+                "indices": index_accessor,
+                "targets": [],
+            }],
+            "weights": [],
+            "extras": {"targetNames": []},
+        })
+        self.gltf["nodes"].append({"name": name, "mesh": len(self.gltf["meshes"]) - 1})
+        self.gltf["scenes"][0]["nodes"].append(len(self.gltf["nodes"]) - 1)
+
+        self._bases.append(positions)
+        self._times.append([])
+        return len(self._bases) - 1
+
+    def add_target(self, handle, name, time, positions):
+        """Add a frame's positions as a sparse morph target shown at time (seconds)"""
+        base = self._bases[handle]
+        delta = np.asarray(positions, dtype=np.float32).reshape(-1, 3) - base
+        if len(delta) != len(base):
+            raise ValueError(f"Expected {len(base)} vertices, got {len(delta)}")
+
+        moved = np.flatnonzero(np.any(delta != 0.0, axis=1)).astype(np.uint32)
+        values = delta[moved]
+
+        # Vertices left out of a sparse accessor are zero, which bounds min/max
+        low = np.zeros(3, dtype=np.float32)
+        high = np.zeros(3, dtype=np.float32)
+        if len(moved):
+            low, high = values.min(axis=0), values.max(axis=0)
+            if len(moved) < len(base):
+                low, high = np.minimum(low, 0.0), np.maximum(high, 0.0)
+
+        accessor = {
+            "componentType": FLOAT,
+            "count": len(base),
+            "type": "VEC3",
+            "min": low.tolist(),
+            "max": high.tolist(),
+        }
+        # An accessor without buffer view or sparse data is all zeros
+        if len(moved):
+            accessor["sparse"] = {
+                "count": len(moved),
+                "indices": {"bufferView": self._add_view(moved), "componentType": UNSIGNED_INT},
+                "values": {"bufferView": self._add_view(values)},
+            }
+
+        mesh = self.gltf["meshes"][handle]
+        mesh["primitives"][0]["targets"].append({"POSITION": self._add_accessor(accessor)})
+        mesh["weights"].append(0.0)
+        mesh["extras"]["targetNames"].append(name)
+        self._times[handle].append(time)
+
+    def _add_animation(self):
+        channels = []
+        samplers = []
+        for handle, times in enumerate(self._times):
+            if not times:
+                continue
+
+            times = np.asarray(times, dtype=np.float32)
+            weights = np.eye(len(times), dtype=np.float32)
+            samplers.append({
+                "input": self._add_accessor({
+                    "bufferView": self._add_view(times),
+                    "componentType": FLOAT,
+                    "count": len(times),
+                    "type": "SCALAR",
+                    "min": [float(times.min())],
+                    "max": [float(times.max())],
+                }),
+                "output": self._add_accessor({
+                    "bufferView": self._add_view(weights),
+                    "componentType": FLOAT,
+                    "count": weights.size,
+                    "type": "SCALAR",
+                }),
+                "interpolation": "STEP",
+            })
+            channels.append({
+                "sampler": len(samplers) - 1,
+                "target": {"node": handle, "path": "weights"},
+            })
+
+        if channels:
+            self.gltf["animations"] = [{"name": "Sequence", "channels": channels, "samplers": samplers}]
+
+    def write(self, filepath):
+        self._add_animation()
+        self.gltf["buffers"] = [{"byteLength": self._length}]
+
+        json_chunk = json.dumps(self.gltf, separators=(",", ":")).encode("utf-8")
+        json_chunk += b" " * (-len(json_chunk) % 4)
+        total = _GLB_HEADER.size + 2 * _CHUNK_HEADER.size + len(json_chunk) + self._length
+
+        with open(filepath, 'wb') as f:
+            f.write(_GLB_HEADER.pack(GLB_MAGIC, 2, total))
+            f.write(_CHUNK_HEADER.pack(len(json_chunk), b"JSON"))
+            f.write(json_chunk)
+            f.write(_CHUNK_HEADER.pack(self._length, b"BIN\0"))
+            for chunk in self._chunks:
+                f.write(chunk)
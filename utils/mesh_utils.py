@@ -1,7 +1,19 @@
 import bpy
+import copy
+import numpy as np
 from pathlib import Path
 import re
 
+from .binary_mesh import BINARY_MESH_EXTENSIONS, read_binary_vertices, read_ply, read_stl
+from .export_manifest import hash_buffers
+from .frame_cache import CACHE_EXTENSION, FrameCacheReader
+from .obj_reader import read_obj_vertices
+from .parallel_reader import iter_parallel_vertices
+
+
+# Frame files the native readers parse without importing them
+NATIVE_EXTENSIONS = {'.obj'} | BINARY_MESH_EXTENSIONS
+
 
 def extract_number(filepath):
     """Extract numbers from filename for sorting"""
@@ -9,6 +21,12 @@ def extract_number(filepath):
     return int(match.group(1)) if match else -1
 
 
+def get_cache_path(filepath):
+    """Frame cache path for a sequence, named after its first file without the frame number"""
+    name = re.sub(r'[_.\-]*\d+$', '', filepath.stem) or "sequence"
+    return filepath.with_name(name + CACHE_EXTENSION)
+
+
 def import_mesh_file(filepath):
     """Import a mesh file according to its extension"""
     file_ext = filepath.suffix.lower()
@@ -18,6 +36,10 @@ def import_mesh_file(filepath):
             bpy.ops.import_scene.fbx(filepath=str(filepath), axis_forward='-Z', axis_up='Y')
         elif file_ext == '.obj':
             bpy.ops.wm.obj_import(filepath=str(filepath))
+        elif file_ext == CACHE_EXTENSION:
+            return create_object_from_cache(filepath)
+        elif file_ext in BINARY_MESH_EXTENSIONS:
+            return import_binary_mesh(filepath)
         else:
             return None
             
@@ -25,4 +47,256 @@ def import_mesh_file(filepath):
         
     except Exception as e:
         print(f"Error importing {filepath}: {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+def import_binary_mesh(filepath):
+    """Build an object from a binary PLY/STL, leaving ASCII files to Blender's importers"""
+    try:
+        if filepath.suffix.lower() == '.stl':
+            positions, polygon_sizes, corner_verts = read_stl(filepath)
+            colors = None
+        else:
+            positions, polygon_sizes, corner_verts, colors = read_ply(filepath)
+    except ValueError:
+        if filepath.suffix.lower() == '.stl':
+            bpy.ops.wm.stl_import(filepath=str(filepath))
+        else:
+            bpy.ops.wm.ply_import(filepath=str(filepath))
+        return bpy.context.selected_objects[-1] if bpy.context.selected_objects else None
+
+    mesh = bpy.data.meshes.new(filepath.stem)
+    mesh.vertices.add(len(positions) // 3)
+    mesh.vertices.foreach_set("co", positions)
+    mesh.loops.add(len(corner_verts))
+    mesh.loops.foreach_set("vertex_index", corner_verts)
+
+    loop_starts = np.zeros(len(polygon_sizes), dtype=np.int32)
+    np.cumsum(polygon_sizes[:-1], out=loop_starts[1:])
+    mesh.polygons.add(len(polygon_sizes))
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+
+    if colors is not None:
+        mesh.color_attributes.new("Col", 'FLOAT_COLOR', 'POINT')
+        mesh.color_attributes.active_color = mesh.color_attributes["Col"]
+        set_vertex_colors(mesh, colors)
+
+    mesh.update(calc_edges=True)
+    mesh.validate()
+
+    obj = bpy.data.objects.new(filepath.stem, mesh)
+    bpy.context.collection.objects.link(obj)
+    bpy.ops.object.select_all(action='DESELECT')
+    obj.select_set(True)
+    return obj
+
+
+def read_frame_vertices(filepath):
+    """Read the positions and vertex colors of an OBJ, PLY or STL frame without importing it"""
+    if filepath.suffix.lower() in BINARY_MESH_EXTENSIONS:
+        return read_binary_vertices(filepath)
+    return read_obj_vertices(filepath)
+
+
+def get_vertex_positions(mesh):
+    """Return the vertex positions of a mesh as a flat float32 array"""
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    return coords
+
+
+def get_shapekey_positions(key_block):
+    """Return the positions stored in a shapekey as a flat float32 array"""
+    coords = np.empty(len(key_block.data) * 3, dtype=np.float32)
+    key_block.data.foreach_get("co", coords)
+    return coords
+
+
+def transform_positions(coords, matrix):
+    """Apply a 4x4 matrix to flat float32 positions"""
+    matrix = np.array(matrix, dtype=np.float32)
+    points = coords.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+    return points.astype(np.float32, copy=False).ravel()
+
+
+def get_triangles(mesh):
+    """Return the vertex indices of the triangulated faces of a mesh as a flat uint32 array"""
+    mesh.calc_loop_triangles()
+    triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", triangles)
+    return triangles.view(np.uint32)
+
+
+def get_topology(mesh):
+    """Return polygon sizes, corner vertex indices and active corner UVs of a mesh"""
+    polygon_sizes = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", polygon_sizes)
+    corner_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", corner_verts)
+
+    corner_uvs = None
+    if mesh.uv_layers.active:
+        corner_uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        mesh.uv_layers.active.data.foreach_get("uv", corner_uvs)
+
+    return polygon_sizes, corner_verts, corner_uvs
+
+
+def get_corner_normals(mesh):
+    """Return the face corner normals of a mesh as a flat float32 array"""
+    normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+    if hasattr(mesh, "corner_normals"):
+        mesh.corner_normals.foreach_get("vector", normals)
+    else:  # Blender 4.0
+        mesh.calc_normals_split()
+        mesh.loops.foreach_get("normal", normals)
+    return normals
+
+
+def get_vertex_colors(mesh):
+    """Return the active point color attribute as flat sRGB floats, or None"""
+    attribute = mesh.color_attributes.active_color
+    if attribute is None or attribute.domain != 'POINT':
+        return None
+
+    rgba = np.empty(len(mesh.vertices) * 4, dtype=np.float32)
+    attribute.data.foreach_get("color_srgb", rgba)
+    return np.ascontiguousarray(rgba.reshape(-1, 4)[:, :3]).ravel()
+
+
+class MeshSample:
+    """Arrays copied out of an evaluated frame mesh for hashing and writing"""
+
+    def __init__(self, mesh, with_colors=False, with_normals=False, with_triangles=False):
+        self.positions = get_vertex_positions(mesh)
+        self.polygon_sizes, self.corner_verts, self.corner_uvs = get_topology(mesh)
+        self.colors = get_vertex_colors(mesh) if with_colors else None
+        self.normals = get_corner_normals(mesh) if with_normals else None
+        self.triangles = get_triangles(mesh) if with_triangles else None
+        self.materials = "\n".join(material.name if material else "" for material in mesh.materials)
+
+    def with_positions(self, positions):
+        """Copy of this sample with other vertex positions and the same topology"""
+        sample = copy.copy(self)
+        sample.positions = positions
+        return sample
+
+    def content_hash(self):
+        """Hash of everything that ends up in the exported file"""
+        return hash_buffers(
+            self.positions, self.polygon_sizes, self.corner_verts,
+            self.corner_uvs, self.colors, self.materials,
+        )
+
+
+def create_object_from_cache(filepath):
+    """Build an object from the topology and first frame of a frame cache"""
+    reader = FrameCacheReader(str(filepath))
+    if not reader.has_topology:
+        raise ValueError(f"{filepath} has no topology to build a mesh from")
+
+    mesh = bpy.data.meshes.new(filepath.stem)
+    mesh.vertices.add(reader.vertex_count)
+    mesh.vertices.foreach_set("co", reader.frame(0))
+    mesh.loops.add(reader.corner_count)
+    mesh.loops.foreach_set("vertex_index", reader.corner_verts.astype(np.int32))
+
+    loop_starts = np.zeros(reader.polygon_count, dtype=np.int32)
+    np.cumsum(reader.polygon_sizes[:-1], out=loop_starts[1:])
+    mesh.polygons.add(reader.polygon_count)
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+
+    if reader.has_uvs:
+        mesh.uv_layers.new(name="UVMap").data.foreach_set("uv", np.array(reader.corner_uvs))
+
+    mesh.update(calc_edges=True)
+    mesh.validate()
+
+    obj = bpy.data.objects.new(filepath.stem, mesh)
+    bpy.context.collection.objects.link(obj)
+    bpy.ops.object.select_all(action='DESELECT')
+    obj.select_set(True)
+    return obj
+
+
+def read_vertex_positions(filepath, native=True):
+    """Read only the vertex positions of a mesh file as a flat float32 array"""
+    if native and filepath.suffix.lower() in NATIVE_EXTENSIONS:
+        try:
+            return read_frame_vertices(filepath)[0]
+        except (OSError, ValueError) as e:
+            print(f"Error reading {filepath}: {e}")
+            return None
+
+    obj = import_mesh_file(filepath)
+    if not obj or obj.type != 'MESH':
+        return None
+
+    mesh = obj.data
+    coords = get_vertex_positions(mesh)
+
+    # The imported datablocks are only needed for their positions
+    bpy.data.objects.remove(obj, do_unlink=True)
+    if mesh.users == 0:
+        bpy.data.meshes.remove(mesh)
+
+    return coords
+
+
+def add_shapekey_from_positions(obj, name, coords):
+    """Add a shapekey to obj and fill it from a flat float32 position buffer"""
+    key_block = obj.shape_key_add(name=name, from_mix=False)
+    key_block.data.foreach_set("co", coords)
+    return key_block
+
+
+def native_reader_matches(filepath, mesh):
+    """Check that the native reader yields the same vertex order as the importer"""
+    if filepath.suffix.lower() not in NATIVE_EXTENSIONS:
+        return False
+
+    coords = read_vertex_positions(filepath)
+    if coords is None or len(coords) != len(mesh.vertices) * 3:
+        return False
+
+    return np.allclose(coords, get_vertex_positions(mesh), atol=1e-5)
+
+
+def iter_vertex_positions(filepaths, vertex_count, native=True, worker_count=1, with_colors=False):
+    """Yield (filepath, positions, colors) for each frame file, in order
+
+    positions is None for frames that could not be read or whose vertex count
+    differs from vertex_count. Native OBJ frames are parsed by worker
+    processes when worker_count is above 1.
+    """
+    if native and worker_count > 1 and all(filepath.suffix.lower() == '.obj' for filepath in filepaths):
+        yield from iter_parallel_vertices(filepaths, vertex_count, worker_count, with_colors)
+        return
+
+    for filepath in filepaths:
+        colors = None
+        if native:
+            try:
+                positions, colors = read_frame_vertices(filepath)
+            except (OSError, ValueError) as e:
+                print(f"Error reading {filepath}: {e}")
+                positions = None
+        else:
+            positions = read_vertex_positions(filepath, native=False)
+
+        if positions is not None and len(positions) != vertex_count * 3:
+            print(f"Skipping {filepath}: vertex count does not match the base mesh")
+            positions = colors = None
+
+        yield filepath, positions, colors if with_colors else None
+
+
+def set_vertex_colors(mesh, colors):
+    """Write flat RGB float values into the active point color attribute"""
+    attribute = mesh.color_attributes.active_color
+    if attribute is None or attribute.domain != 'POINT':
+        return
+
+    rgba = np.ones((len(mesh.vertices), 4), dtype=np.float32)
+    rgba[:, :3] = colors.reshape(-1, 3)
+    attribute.data.foreach_set("color_srgb", rgba.ravel())
@@ -0,0 +1,68 @@
+"""Minimal OBJ reader for mesh sequences (no bpy imports allowed here)"""
+
+import re
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+_VERTEX_LINE = re.compile(rb'^v[ \t]+([^\r\n]*)', re.MULTILINE)
+_SPACE_RUN = re.compile(rb'[ \t]+')
+_TRAILING_SPACE = re.compile(rb' +$', re.MULTILINE)
+
+
+def read_obj_vertices(filepath):
+    """Parse the ``v`` lines of an OBJ file.
+
+    Returns a tuple ``(positions, colors)`` of flat float32 arrays. ``colors``
+    is None unless every vertex carries the ``v x y z r g b`` color extension.
+    """
+    with open(filepath, 'rb') as f:
+        data = f.read()
+
+    rows = _VERTEX_LINE.findall(data)
+    vertex_count = len(rows)
+    if vertex_count == 0:
+        return np.empty(0, dtype=np.float32), None
+
+    # Token count of every row, from its single-space separators
+    joined = _TRAILING_SPACE.sub(b'', _SPACE_RUN.sub(b' ', b'\n'.join(rows)))
+    token_counts = np.char.count(np.array(joined.split(b'\n')), b' ') + 1
+    components = int(token_counts[0])
+
+    if components in (3, 4, 6) and np.all(token_counts == components):
+        values = np.array(joined.split(), dtype=np.float32).reshape(vertex_count, components)
+    else:
+        # Mixed records (e.g. some vertices with colors): parse line by line
+        values = np.array([row.split()[:3] for row in rows], dtype=np.float32)
+        components = 3
+
+    positions = np.ascontiguousarray(values[:, :3]).ravel()
+    colors = np.ascontiguousarray(values[:, 3:6]).ravel() if components == 6 else None
+    return positions, colors
+
+
+def read_obj_into_buffer(filepath, buffer_name, offset, vertex_count, with_colors=False):
+    """Parse an OBJ file into a slot of a shared memory block (worker process entry)
+
+    Returns ``(vertex_count, has_colors)`` of the parsed file; nothing is
+    written when the vertex count does not match the slot.
+    """
+    positions, colors = read_obj_vertices(filepath)
+    count = positions.size // 3
+    if count != vertex_count:
+        return count, False
+
+    has_colors = with_colors and colors is not None
+    block = shared_memory.SharedMemory(name=buffer_name)
+    try:
+        size = vertex_count * (6 if with_colors else 3)
+        slot = np.ndarray((size,), dtype=np.float32, buffer=block.buf, offset=offset)
+        slot[:positions.size] = positions
+        if has_colors:
+            slot[positions.size:] = colors
+        del slot
+    finally:
+        block.close()
+
+    return count, has_colors
@@ -0,0 +1,90 @@
+"""Streaming OBJ writer for mesh sequences"""
+
+import numpy as np
+
+
+# Rows formatted per % call; keeps the temporary format string small
+_CHUNK_ROWS = 65536
+
+
+def to_obj_axes(vectors):
+    """Convert Blender Z-up vectors to the Y-up axes of Blender's OBJ exporter"""
+    vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, 3)
+    converted = np.empty_like(vectors)
+    converted[:, 0] = vectors[:, 0]
+    converted[:, 1] = vectors[:, 2]
+    converted[:, 2] = -vectors[:, 1]
+    return converted
+
+
+def format_rows(prefix, values, columns):
+    """Format a flat float array as OBJ records with one % call per chunk"""
+    rows = np.asarray(values, dtype=np.float32).reshape(-1, columns)
+    line = prefix + " %.6f" * columns + "\n"
+    return "".join(
+        (line * len(block)) % tuple(block.ravel().tolist())
+        for block in (rows[start:start + _CHUNK_ROWS] for start in range(0, len(rows), _CHUNK_ROWS))
+    )
+
+
+class ObjSequenceWriter:
+    """Write OBJ frames that share one topology
+
+    The UV and face sections are formatted once; each frame only formats its
+    vertex (and normal) records and is written with a single buffered write.
+    """
+
+    def __init__(self, name, polygon_sizes, corner_verts, corner_uvs=None, use_normals=True):
+        self.name = name
+        self.polygon_sizes = np.asarray(polygon_sizes, dtype=np.int32)
+        self.corner_verts = np.asarray(corner_verts, dtype=np.int32)
+        self.use_normals = use_normals
+
+        self._uv_section = format_rows("vt", corner_uvs, 2) if corner_uvs is not None else ""
+        self._face_section = self._format_faces(corner_uvs is not None)
+
+    def matches(self, polygon_sizes, corner_verts):
+        """Check whether a frame still has the topology this writer was built for"""
+        return np.array_equal(self.polygon_sizes, polygon_sizes) and np.array_equal(self.corner_verts, corner_verts)
+
+    def _format_faces(self, use_uvs):
+        # Corner i uses vt/vn record i, so the face section never changes
+        verts = self.corner_verts + 1
+        corners = np.arange(1, verts.size + 1, dtype=np.int64)
+        if use_uvs and self.use_normals:
+            fmt, columns = "%d/%d/%d", (verts, corners, corners)
+        elif use_uvs:
+            fmt, columns = "%d/%d", (verts, corners)
+        elif self.use_normals:
+            fmt, columns = "%d//%d", (verts, corners)
+        else:
+            fmt, columns = "%d", (verts,)
+
+        values = np.column_stack(columns).ravel().tolist()
+        tokens = ((fmt + " ") * verts.size % tuple(values)).split()
+
+        lines = []
+        start = 0
+        for size in self.polygon_sizes.tolist():
+            lines.append("f " + " ".join(tokens[start:start + size]) + "\n")
+            start += size
+        return "".join(lines)
+
+    def write(self, filepath, positions, normals=None, colors=None):
+        """Write one frame; positions, normals and colors are flat Blender-space arrays"""
+        vertices = to_obj_axes(positions)
+        if colors is not None:
+            vertices = np.hstack((vertices, np.asarray(colors, dtype=np.float32).reshape(-1, 3)))
+
+        sections = [
+            "# anim-seq OBJ frame\n",
+            f"o {self.name}\n",
+            format_rows("v", vertices, vertices.shape[1]),
+            self._uv_section,
+        ]
+        if self.use_normals and normals is not None:
+            sections.append(format_rows("vn", to_obj_axes(normals), 3))
+        sections.append(self._face_section)
+
+        with open(filepath, 'w', encoding='utf-8', newline='\n') as f:
+            f.write("".join(sections))
@@ -0,0 +1,109 @@
+"""Parse OBJ sequence frames in worker processes (no bpy imports allowed here)"""
+
+import importlib
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+
+
+def _load_worker_module():
+    """Import obj_reader as a top-level module so workers never import the addon (and bpy)"""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    if directory not in sys.path:
+        sys.path.append(directory)
+    return importlib.import_module("obj_reader")
+
+
+def _read_in_process(worker, filepath, vertex_count, with_colors):
+    """Parse a frame in this process, for when the worker pool cannot"""
+    try:
+        positions, colors = worker.read_obj_vertices(filepath)
+    except (OSError, ValueError) as e:
+        print(f"Error reading {filepath}: {e}")
+        return None, None
+
+    if positions.size != vertex_count * 3:
+        return None, None
+    return positions, colors if with_colors else None
+
+
+def iter_parallel_vertices(filepaths, vertex_count, worker_count, with_colors=False):
+    """Yield ``(filepath, positions, colors)`` for each OBJ file, in order
+
+    Files are parsed by ``worker_count`` processes into slots of one shared
+    memory block owned by this process. ``positions`` is None for files that
+    failed to parse or whose vertex count differs from ``vertex_count``.
+    If the pool cannot start or breaks, the remaining files are parsed in
+    this process instead.
+    """
+    if not filepaths:
+        return
+
+    worker = _load_worker_module()
+    stride = vertex_count * (6 if with_colors else 3)
+    slot_count = min(len(filepaths), worker_count * 2)
+    block = shared_memory.SharedMemory(create=True, size=max(stride * 4, 1) * slot_count)
+    pending = deque()
+    executor = None
+
+    try:
+        try:
+            executor = ProcessPoolExecutor(max_workers=worker_count, mp_context=get_context("spawn"))
+        except Exception as e:
+            print(f"Error starting worker processes, reading frames in this process: {e}")
+
+        def submit(index):
+            offset = (index % slot_count) * stride * 4
+            future = None
+            if executor is not None:
+                try:
+                    future = executor.submit(
+                        worker.read_obj_into_buffer, str(filepaths[index]),
+                        block.name, offset, vertex_count, with_colors,
+                    )
+                except Exception as e:
+                    print(f"Error queueing {filepaths[index]}, reading it in this process: {e}")
+            pending.append(future)
+
+        for index in range(slot_count):
+            submit(index)
+
+        for index, filepath in enumerate(filepaths):
+            future = pending.popleft()
+            positions = colors = None
+            try:
+                if future is None:
+                    raise RuntimeError("worker pool unavailable")
+                count, has_colors = future.result()
+            except Exception as e:
+                # A broken pool must not drop frames: parse them here instead
+                if future is not None:
+                    print(f"Error reading {filepath} in a worker, retrying in this process: {e}")
+                positions, colors = _read_in_process(worker, filepath, vertex_count, with_colors)
+                count = has_colors = None
+
+            if count == vertex_count:
+                offset = (index % slot_count) * stride
+                slot = np.ndarray((slot_count * stride,), dtype=np.float32, buffer=block.buf)
+                positions = slot[offset:offset + vertex_count * 3].copy()
+                if has_colors:
+                    colors = slot[offset + vertex_count * 3:offset + stride].copy()
+                del slot
+
+            # The slot is free again once its frame has been copied out
+            if index + slot_count < len(filepaths):
+                submit(index + slot_count)
+
+            yield filepath, positions, colors
+    finally:
+        for future in pending:
+            if future is not None:
+                future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=True)
+        block.close()
+        block.unlink()
@@ -0,0 +1,118 @@
+"""PC2 and MDD point cache files
+
+PC2 is little-endian with a 32 byte header; MDD is big-endian with a frame
+count, point count and one time value per frame ahead of the points. Both
+store frames as contiguous float32 xyz triplets.
+"""
+
+import struct
+
+import numpy as np
+
+
+PC2_MAGIC = b"POINTCACHE2\0"
+# magic, version, point count, start frame, sample rate, sample count
+_PC2_HEADER = struct.Struct("<12siiffi")
+_MDD_HEADER = struct.Struct(">ii")
+
+POINT_CACHE_EXTENSIONS = {'PC2': ".pc2", 'MDD': ".mdd"}
+
+
+def point_cache_format(filepath):
+    """Return 'PC2' or 'MDD' for a point cache path, or None"""
+    lower = str(filepath).lower()
+    for cache_format, ext in POINT_CACHE_EXTENSIONS.items():
+        if lower.endswith(ext):
+            return cache_format
+    return None
+
+
+class PointCacheWriter:
+    """Append frames of a fixed point count to one PC2 or MDD file"""
+
+    def __init__(self, filepath, cache_format, point_count, frame_count, frame_start=0, frame_step=1, fps=24.0):
+        self.filepath = filepath
+        self.cache_format = cache_format
+        self.point_count = point_count
+        self.frame_count = frame_count
+        self.written = 0
+        self._file = open(filepath, 'wb')
+
+        if cache_format == 'PC2':
+            self._dtype = np.dtype('<f4')
+            self._file.write(_PC2_HEADER.pack(PC2_MAGIC, 1, point_count, float(frame_start), float(frame_step), frame_count))
+        else:
+            # MDD stores the time of every frame up front, so the count is fixed
+            self._dtype = np.dtype('>f4')
+            self._file.write(_MDD_HEADER.pack(frame_count, point_count))
+            times = (frame_start + np.arange(frame_count) * frame_step) / fps
+            self._file.write(times.astype(self._dtype).tobytes())
+
+    def write_frame(self, positions):
+        positions = np.asarray(positions, dtype=np.float32)
+        if positions.size != self.point_count * 3:
+            raise ValueError(f"Expected {self.point_count} points, got {positions.size // 3}")
+        if self.written >= self.frame_count:
+            raise ValueError("All frames of the point cache have already been written")
+        self._file.write(positions.astype(self._dtype, copy=False).tobytes())
+        self.written += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class PointCacheReader:
+    """Memory-map the frames of a PC2 or MDD file"""
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.cache_format = point_cache_format(filepath)
+        self.times = None
+
+        with open(filepath, 'rb') as f:
+            if self.cache_format == 'PC2':
+                header = f.read(_PC2_HEADER.size)
+                if len(header) != _PC2_HEADER.size or header[:12] != PC2_MAGIC:
+                    raise ValueError(f"{filepath} is not a PC2 file")
+                _magic, _version, self.point_count, start, rate, self.frame_count = _PC2_HEADER.unpack(header)
+                self.frame_start = start
+                self.frame_step = rate or 1.0
+                dtype = np.dtype('<f4')
+                offset = _PC2_HEADER.size
+            elif self.cache_format == 'MDD':
+                header = f.read(_MDD_HEADER.size)
+                if len(header) != _MDD_HEADER.size:
+                    raise ValueError(f"{filepath} is not an MDD file")
+                self.frame_count, self.point_count = _MDD_HEADER.unpack(header)
+                dtype = np.dtype('>f4')
+                self.times = np.frombuffer(f.read(self.frame_count * 4), dtype=dtype).astype(np.float32)
+                offset = _MDD_HEADER.size + self.frame_count * 4
+            else:
+                raise ValueError(f"{filepath} is not a PC2 or MDD file")
+
+        if self.frame_count <= 0 or self.point_count <= 0:
+            raise ValueError(f"{filepath} contains no points")
+
+        self._frames = np.memmap(
+            filepath, dtype=dtype, mode='r', offset=offset,
+            shape=(self.frame_count, self.point_count * 3),
+        )
+
+    def frame_range(self, fps):
+        """Return (start, step) in scene frames, with start rounded to a whole frame"""
+        if self.times is None:
+            return round(float(self.frame_start)), float(self.frame_step)
+        start = self.times[0] * fps
+        step = (self.times[1] - self.times[0]) * fps if self.frame_count > 1 else 1.0
+        return round(float(start)), float(step) or 1.0
+
+    def frame(self, index):
+        """Return the flat positions of a frame as native float32, clamped to the cached range"""
+        index = min(max(index, 0), self.frame_count - 1)
+        return self._frames[index].astype(np.float32)
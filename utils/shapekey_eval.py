@@ -0,0 +1,95 @@
+"""Numeric evaluation of shapekey-only deformation
+
+Reads every key's coordinates once and evaluates the key's fcurves per
+frame, so frames can be sampled without frame_set or a depsgraph update.
+"""
+
+import numpy as np
+
+from .mesh_utils import get_shapekey_positions, transform_positions
+
+
+def supports_shapekey_eval(obj):
+    """Check that obj is only deformed by fcurve-animated shapekeys and never moves"""
+    if obj.type != 'MESH' or not obj.data.shape_keys:
+        return False
+    if obj.parent or obj.constraints or obj.show_only_shape_key or obj.matrix_world.is_negative:
+        return False
+    if any(modifier.show_viewport for modifier in obj.modifiers):
+        return False
+    animation_data = obj.animation_data
+    if animation_data and (animation_data.action or animation_data.drivers or animation_data.nla_tracks):
+        return False
+
+    key = obj.data.shape_keys
+    if key.animation_data and (key.animation_data.drivers or key.animation_data.nla_tracks):
+        return False
+    if any(key_block.vertex_group for key_block in key.key_blocks):
+        return False
+    if not key.use_relative and any(key_block.interpolation != 'KEY_LINEAR' for key_block in key.key_blocks):
+        return False
+    return True
+
+
+class ShapeKeyEvaluator:
+    """World-space positions of a shapekey-only object at any frame
+
+    Relative keys give basis + sum of weight * (key - relative key); absolute
+    keys blend the two keys around the evaluation time linearly.
+    """
+
+    # Only the fcurves are evaluated, never the scene
+    needs_scene = False
+
+    def __init__(self, obj):
+        key = obj.data.shape_keys
+        key_blocks = key.key_blocks
+        self.matrix = obj.matrix_world.copy()
+        self.coords = np.stack([get_shapekey_positions(key_block) for key_block in key_blocks])
+        self.use_relative = key.use_relative
+
+        action = key.animation_data.action if key.animation_data else None
+        fcurves = {fcurve.data_path: fcurve for fcurve in action.fcurves} if action else {}
+
+        if self.use_relative:
+            self.reference = key_blocks.find(key.reference_key.name)
+            self.relative = np.array([key_blocks.find(key_block.relative_key.name) for key_block in key_blocks])
+            self.values = np.array([0.0 if key_block.mute else key_block.value for key_block in key_blocks])
+            self.slider_min = np.array([key_block.slider_min for key_block in key_blocks])
+            self.slider_max = np.array([key_block.slider_max for key_block in key_blocks])
+            self.curves = []
+            for index, key_block in enumerate(key_blocks):
+                fcurve = fcurves.get(key_block.path_from_id("value"))
+                if fcurve and not fcurve.mute and not key_block.mute and index != self.reference:
+                    self.curves.append((index, fcurve))
+        else:
+            self.key_frames = np.array([key_block.frame for key_block in key_blocks])
+            self.eval_time = key.eval_time
+            self.eval_curve = fcurves.get("eval_time")
+
+    def local_positions(self, frame):
+        if not self.use_relative:
+            time = self.eval_curve.evaluate(frame) if self.eval_curve else self.eval_time
+            if time <= self.key_frames[0]:
+                return self.coords[0].copy()
+            if time >= self.key_frames[-1]:
+                return self.coords[-1].copy()
+            index = int(np.searchsorted(self.key_frames, time, side='right')) - 1
+            span = self.key_frames[index + 1] - self.key_frames[index]
+            factor = (time - self.key_frames[index]) / span if span else 0.0
+            return (1.0 - factor) * self.coords[index] + factor * self.coords[index + 1]
+
+        weights = self.values.copy()
+        for index, fcurve in self.curves:
+            weights[index] = fcurve.evaluate(frame)
+        np.clip(weights, self.slider_min, self.slider_max, out=weights)
+        weights[self.reference] = 0.0
+
+        positions = self.coords[self.reference].copy()
+        for index in np.flatnonzero(weights):
+            positions += weights[index] * (self.coords[index] - self.coords[self.relative[index]])
+        return positions
+
+    def positions(self, frame, depsgraph=None):
+        """Flat float32 world-space positions at frame"""
+        return transform_positions(self.local_positions(frame).astype(np.float32), self.matrix)
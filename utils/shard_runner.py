@@ -0,0 +1,80 @@
+"""Run export shards in background Blender processes"""
+
+import subprocess
+import threading
+
+
+# Lines printed by a shard on stdout
+PROGRESS_PREFIX = "ANIM_SEQ_PROGRESS"
+DONE_PREFIX = "ANIM_SEQ_DONE"
+
+# Script run by each background Blender: enables the addon, selects the
+# exported objects and runs the exporter with the parent's settings.
+SHARD_SCRIPT = """
+import addon_utils, bpy, json
+addon_utils.enable({module!r}, default_set=False)
+settings = json.loads({settings!r})
+names = set(settings.pop("object_names"))
+for obj in bpy.context.view_layer.objects:
+    obj.select_set(obj.name in names)
+bpy.ops.export_scene.meshseq(**settings)
+"""
+
+
+def split_frames(frame_start, frame_end, frame_step, shard_count):
+    """Split a frame range into contiguous (start, end) shards that keep the step"""
+    frames = list(range(frame_start, frame_end + 1, frame_step))
+    if not frames:
+        return []
+    # The first `extra` shards take one frame more, so none is left empty
+    count = min(max(shard_count, 1), len(frames))
+    size, extra = divmod(len(frames), count)
+    shards = []
+    start = 0
+    for index in range(count):
+        end = start + size + (index < extra)
+        shards.append((frames[start], frames[end - 1]))
+        start = end
+    return shards
+
+
+def run_shards(commands, on_progress=None):
+    """Run every command concurrently and collect the exported-file counts
+
+    on_progress(done_frames) is called from the calling thread whenever a
+    shard reports a finished frame. Returns a list of (returncode, exported).
+    """
+    lock = threading.Lock()
+    done_frames = [0]
+    exported = [0] * len(commands)
+    processes = [
+        subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                         text=True, errors='replace')
+        for command in commands
+    ]
+
+    def read_output(index, process):
+        for line in process.stdout:
+            if line.startswith(PROGRESS_PREFIX):
+                with lock:
+                    done_frames[0] += 1
+            elif line.startswith(DONE_PREFIX):
+                exported[index] = int(line.split()[1])
+            elif line.strip():
+                print(f"[shard {index}] {line.rstrip()}")
+
+    readers = [threading.Thread(target=read_output, args=(i, p), daemon=True) for i, p in enumerate(processes)]
+    for reader in readers:
+        reader.start()
+
+    reported = 0
+    while any(reader.is_alive() for reader in readers):
+        for reader in readers:
+            reader.join(timeout=0.1)
+        with lock:
+            current = done_frames[0]
+        if on_progress and current != reported:
+            reported = current
+            on_progress(current)
+
+    return [(process.wait(), count) for process, count in zip(processes, exported)]
@@ -0,0 +1,114 @@
+import bpy
+import os
+import numpy as np
+from bpy.app.handlers import persistent
+
+from ..addon_updater_ops import get_user_preferences
+from .frame_cache import FrameCacheReader
+from .frame_lru import FrameLRU
+from .frame_prefetch import FramePrefetcher
+
+
+# Custom properties linking a streamed object to its frame cache
+CACHE_PATH_PROP = "anim_seq_cache"
+FRAME_START_PROP = "anim_seq_frame_start"
+
+# Open readers keyed by absolute path, with the mtime they were opened at
+_readers = {}
+
+# Decoded frames keyed by (object name, frame index), shared by all streamed objects
+frame_lru = FrameLRU()
+
+# Reads frames ahead of the playhead into frame_lru
+prefetcher = FramePrefetcher(frame_lru)
+
+
+def get_reader(filepath):
+    """Return a memory-mapped reader for a cache file, reopening it if it changed"""
+    path = bpy.path.abspath(filepath)
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        return None
+
+    entry = _readers.get(path)
+    if entry is None or entry[0] != mtime:
+        try:
+            entry = (mtime, FrameCacheReader(path))
+        except (OSError, ValueError) as e:
+            print(f"Error opening frame cache {path}: {e}")
+            return None
+        _readers[path] = entry
+        # Frames decoded from an older version of this cache are stale
+        prefetcher.clear()
+        frame_lru.clear()
+
+    return entry[1]
+
+
+def apply_cached_frame(obj, frame, prefetch=False):
+    """Push the cached positions for a scene frame into a streamed object's mesh"""
+    reader = get_reader(obj[CACHE_PATH_PROP])
+    mesh = obj.data
+    if reader is None or reader.vertex_count != len(mesh.vertices):
+        return
+
+    index = min(max(frame - obj.get(FRAME_START_PROP, 0), 0), reader.frame_count - 1)
+    key = (obj.name, index)
+    coords = frame_lru.get(key)
+    if coords is None:
+        coords = np.array(reader.frame(index))
+        frame_lru.put(key, coords)
+
+    mesh.vertices.foreach_set("co", coords)
+    mesh.update()
+
+    if prefetch:
+        prefetcher.update(obj.name, reader, index)
+
+
+def apply_preferences(prefs=None):
+    """Apply the streamed playback settings from the addon preferences
+
+    Returns whether frames should be read ahead of the playhead.
+    """
+    prefs = prefs or get_user_preferences()
+    if prefs is None:
+        return False
+
+    frame_lru.set_budget(prefs.frame_cache_budget_mb * 1024 * 1024)
+    prefetcher.max_ahead = prefs.prefetch_max_frames
+    return prefs.use_prefetch
+
+
+@persistent
+def update_streamed_objects(scene, depsgraph=None):
+    """frame_change_pre handler: only the current frame of each cache is touched"""
+    prefetch = apply_preferences()
+    for obj in scene.objects:
+        if obj.type == 'MESH' and CACHE_PATH_PROP in obj:
+            apply_cached_frame(obj, scene.frame_current, prefetch)
+
+
+@persistent
+def close_readers(*args):
+    """Drop every open cache when another .blend is loaded"""
+    prefetcher.clear()
+    _readers.clear()
+    frame_lru.clear()
+
+
+def register():
+    bpy.app.handlers.frame_change_pre.append(update_streamed_objects)
+    bpy.app.handlers.load_pre.append(close_readers)
+    prefetcher.start()
+
+
+def unregister():
+    if update_streamed_objects in bpy.app.handlers.frame_change_pre:
+        bpy.app.handlers.frame_change_pre.remove(update_streamed_objects)
+    if close_readers in bpy.app.handlers.load_pre:
+        bpy.app.handlers.load_pre.remove(close_readers)
+    prefetcher.stop()
+    _readers.clear()
+    frame_lru.clear()
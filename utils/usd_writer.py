@@ -0,0 +1,92 @@
+"""USD stages with time-sampled mesh points
+
+The pxr module ships with Blender builds that include USD support. Without
+it usd_available() is False and the USD export format cannot be used.
+"""
+
+import numpy as np
+
+try:
+    from pxr import Gf, Sdf, Tf, Usd, UsdGeom, Vt
+except ImportError:
+    Usd = None
+
+
+def usd_available():
+    return Usd is not None
+
+
+class UsdSequenceWriter:
+    """Author each mesh's topology once and its points as time samples
+
+    Positions are written as given (Blender's Z-up world space). A mesh whose
+    topology changes gets time-sampled face arrays from that frame on.
+    """
+
+    def __init__(self, filepath, frame_start, frame_end, fps):
+        self.stage = Usd.Stage.CreateNew(filepath)
+        UsdGeom.SetStageUpAxis(self.stage, UsdGeom.Tokens.z)
+        UsdGeom.SetStageMetersPerUnit(self.stage, 1.0)
+        self.stage.SetStartTimeCode(frame_start)
+        self.stage.SetEndTimeCode(frame_end)
+        self.stage.SetTimeCodesPerSecond(fps)
+        self.stage.SetFramesPerSecond(fps)
+
+        root = UsdGeom.Xform.Define(self.stage, "/root")
+        self.stage.SetDefaultPrim(root.GetPrim())
+        self._meshes = {}
+
+    def _prim_path(self, name):
+        identifier = Tf.MakeValidIdentifier(name)
+        path = f"/root/{identifier}"
+        counter = 1
+        while self.stage.GetPrimAtPath(path):
+            path = f"/root/{identifier}_{counter:03d}"
+            counter += 1
+        return path
+
+    def add_mesh(self, name, frame, polygon_sizes, corner_verts, corner_uvs=None):
+        """Define a mesh prim with the topology of its first frame"""
+        mesh = UsdGeom.Mesh.Define(self.stage, self._prim_path(name))
+        mesh.CreateSubdivisionSchemeAttr(UsdGeom.Tokens.none)
+        mesh.CreateFaceVertexCountsAttr(Vt.IntArray.FromNumpy(polygon_sizes))
+        mesh.CreateFaceVertexIndicesAttr(Vt.IntArray.FromNumpy(corner_verts))
+        mesh.CreatePointsAttr()
+        mesh.CreateExtentAttr()
+
+        if corner_uvs is not None:
+            primvar = UsdGeom.PrimvarsAPI(mesh).CreatePrimvar(
+                "st", Sdf.ValueTypeNames.TexCoord2fArray, UsdGeom.Tokens.faceVarying)
+            primvar.Set(Vt.Vec2fArray.FromNumpy(corner_uvs.reshape(-1, 2)))
+
+        self._meshes[name] = [mesh, frame, polygon_sizes, corner_verts, False]
+
+    def has_mesh(self, name):
+        return name in self._meshes
+
+    def write_frame(self, name, frame, positions, polygon_sizes, corner_verts):
+        """Add a time sample of a mesh's points, and of its faces if they changed"""
+        entry = self._meshes[name]
+        mesh, first_frame, last_sizes, last_verts, sampled = entry
+        time = Usd.TimeCode(frame)
+
+        if not (np.array_equal(polygon_sizes, last_sizes) and np.array_equal(corner_verts, last_verts)):
+            counts = mesh.GetFaceVertexCountsAttr()
+            indices = mesh.GetFaceVertexIndicesAttr()
+            if not sampled:
+                # Time samples override the default value at every time
+                counts.Set(Vt.IntArray.FromNumpy(last_sizes), Usd.TimeCode(first_frame))
+                indices.Set(Vt.IntArray.FromNumpy(last_verts), Usd.TimeCode(first_frame))
+            counts.Set(Vt.IntArray.FromNumpy(polygon_sizes), time)
+            indices.Set(Vt.IntArray.FromNumpy(corner_verts), time)
+            entry[2:] = [polygon_sizes, corner_verts, True]
+
+        points = positions.reshape(-1, 3)
+        mesh.GetPointsAttr().Set(Vt.Vec3fArray.FromNumpy(points), time)
+        if len(points):
+            low, high = points.min(axis=0), points.max(axis=0)
+            extent = Vt.Vec3fArray([Gf.Vec3f(*map(float, low)), Gf.Vec3f(*map(float, high))])
+            mesh.GetExtentAttr().Set(extent, time)
+
+    def save(self):
+        self.stage.GetRootLayer().Save()